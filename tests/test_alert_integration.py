@@ -15,6 +15,7 @@ from typing import Any, Dict, List, Optional, Generator
 
 import pytest
 
+from trader import alert
 from trader.alert import send_alert
 
 
@@ -95,6 +96,18 @@ class TestAlertWebhookIntegration:
         assert result is True
         assert len(WebhookRequestHandler.received_requests) == 1
     
+    def test_webhook_reuses_shared_session(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that consecutive alerts are posted through one shared session."""
+        monkeypatch.setenv("ALERT_WEBHOOK_URL", self.webhook_url)
+
+        assert send_alert("First message", "error") is True
+        session = alert._session
+        assert send_alert("Second message", "error") is True
+
+        assert session is not None
+        assert alert._session is session
+        assert len(WebhookRequestHandler.received_requests) == 2
+
     def test_webhook_receives_correct_payload_structure(self) -> None:
         """Test that webhook receives correct JSON payload structure."""
         send_alert("Test message", "warning")
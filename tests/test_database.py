@@ -2,11 +2,13 @@
 import os
 import sqlite3
 import tempfile
+import threading
 from pathlib import Path
 
 import pytest
 
-from trader.database import DatabaseConnection, get_connection
+from trader.database import ConnectionPool, DatabaseConnection, get_connection
+from trader.schema import create_tables, drop_tables
 
 
 class TestDatabaseConnection:
@@ -202,6 +204,170 @@ class TestDatabaseConnection:
             db.execute("INVALID SQL SYNTAX")
         db.close()
 
+    def test_connection_usable_from_other_thread(self) -> None:
+        """Verify check_same_thread=False lets another thread use the connection."""
+        db = DatabaseConnection(check_same_thread=False)
+        db.connect()
+        results = []
+
+        worker = threading.Thread(target=lambda: results.append(db.execute("SELECT 1 AS one")))
+        worker.start()
+        worker.join()
+
+        assert results == [[{"one": 1}]]
+        db.close()
+
+    def test_connect_applies_pragmas(self) -> None:
+        """Verify connect() runs the configured PRAGMAs on the new connection."""
+        db = DatabaseConnection(pragmas={"temp_store": "MEMORY", "cache_size": -4000})
+
+        assert db.execute("PRAGMA temp_store")[0]["temp_store"] == 2  # MEMORY
+        assert db.execute("PRAGMA cache_size")[0]["cache_size"] == -4000
+        db.close()
+
+    def test_execute_insert_returns_lastrowid(self) -> None:
+        """Verify execute_insert() returns the ID of each inserted row."""
+        db = DatabaseConnection()
+        db.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)")
+        first = db.execute_insert("INSERT INTO test (name) VALUES (?)", ("one",))
+        second = db.execute_insert("INSERT INTO test (name) VALUES (?)", ("two",))
+        assert (first, second) == (1, 2)
+        result = db.execute("SELECT name FROM test WHERE id = ?", (second,))
+        assert result[0]["name"] == "two"
+        db.close()
+
+    def test_executemany_inserts_all_rows(self) -> None:
+        """Verify executemany() inserts every parameter set."""
+        db = DatabaseConnection()
+        db.execute("CREATE TABLE test (id INTEGER, name TEXT)")
+        db.executemany(
+            "INSERT INTO test (id, name) VALUES (?, ?)",
+            [(1, "one"), (2, "two"), (3, "three")],
+        )
+        result = db.execute("SELECT COUNT(*) AS count FROM test")
+        assert result[0]["count"] == 3
+        db.close()
+
+    def test_executemany_rolls_back_on_error(self) -> None:
+        """Verify executemany() leaves no partial batch behind on failure."""
+        db = DatabaseConnection()
+        db.execute("CREATE TABLE test (id INTEGER PRIMARY KEY)")
+        with pytest.raises(sqlite3.Error):
+            db.executemany("INSERT INTO test (id) VALUES (?)", [(1,), (1,)])
+        result = db.execute("SELECT COUNT(*) AS count FROM test")
+        assert result[0]["count"] == 0
+        db.close()
+
+    def test_transaction_commits_all_statements(self) -> None:
+        """Verify transaction() commits every statement run on its cursor."""
+        db = DatabaseConnection()
+        db.execute("CREATE TABLE test (id INTEGER PRIMARY KEY)")
+        with db.transaction() as cursor:
+            cursor.execute("INSERT INTO test (id) VALUES (1)")
+            cursor.execute("INSERT INTO test (id) VALUES (2)")
+        result = db.execute("SELECT COUNT(*) AS count FROM test")
+        assert result[0]["count"] == 2
+        db.close()
+
+    def test_transaction_rolls_back_on_error(self) -> None:
+        """Verify transaction() discards every statement when the block raises."""
+        db = DatabaseConnection()
+        db.execute("CREATE TABLE test (id INTEGER PRIMARY KEY)")
+        with pytest.raises(sqlite3.Error):
+            with db.transaction() as cursor:
+                cursor.execute("INSERT INTO test (id) VALUES (1)")
+                cursor.execute("INSERT INTO test (id) VALUES (1)")
+        result = db.execute("SELECT COUNT(*) AS count FROM test")
+        assert result[0]["count"] == 0
+        db.close()
+
+    def test_create_tables_recreates_externally_dropped_table(self) -> None:
+        """Verify create_tables() restores a table dropped outside drop_tables()."""
+        db = DatabaseConnection()
+        create_tables(db)
+        db.execute("DROP TABLE scraper_failures")
+
+        create_tables(db)
+        assert db.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'scraper_failures'"
+        )
+        db.close()
+
+class TestConnectionPool:
+    """Test cases for ConnectionPool class."""
+
+    def test_rejects_in_memory_database(self) -> None:
+        """Verify pooling an in-memory database is refused."""
+        with pytest.raises(ValueError):
+            ConnectionPool(":memory:")
+
+    def test_released_connection_is_reused(self, tmp_path: Path) -> None:
+        """Verify acquire() hands back the most recently released connection."""
+        pool = ConnectionPool(str(tmp_path / "pool.db"))
+        conn = pool.acquire()
+        pool.release(conn)
+
+        assert pool.acquire() is conn
+        assert pool.size == 1
+        pool.close()
+
+    def test_min_idle_opens_connections_up_front(self, tmp_path: Path) -> None:
+        """Verify min_idle connections exist before the first acquire()."""
+        pool = ConnectionPool(str(tmp_path / "pool.db"), min_idle=2)
+
+        assert pool.size == 2
+        pool.close()
+        assert pool.size == 0
+
+    def test_acquire_times_out_when_exhausted(self, tmp_path: Path) -> None:
+        """Verify acquire() gives up once max_size connections are in use."""
+        pool = ConnectionPool(str(tmp_path / "pool.db"), max_size=1, timeout=0.01)
+        pool.acquire()
+
+        with pytest.raises(TimeoutError):
+            pool.acquire()
+        pool.close()
+
+    def test_expired_connection_is_replaced(self, tmp_path: Path) -> None:
+        """Verify connections past max_lifetime are closed on release."""
+        pool = ConnectionPool(str(tmp_path / "pool.db"), max_lifetime=0.0)
+        conn = pool.acquire()
+        pool.release(conn)
+
+        assert pool.size == 0
+        assert pool.acquire() is not conn
+        pool.close()
+
+    def test_release_rolls_back_open_transaction(self, tmp_path: Path) -> None:
+        """Verify uncommitted work is discarded when a connection is returned."""
+        pool = ConnectionPool(str(tmp_path / "pool.db"))
+        with pool.connection() as conn:
+            conn.execute("CREATE TABLE test (id INTEGER)")
+            conn.execute("INSERT INTO test (id) VALUES (1)")
+
+        with pool.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 0
+        pool.close()
+
+    def test_pool_applies_pragmas(self, tmp_path: Path) -> None:
+        """Verify every pooled connection gets the pool's PRAGMAs."""
+        pool = ConnectionPool(str(tmp_path / "pool.db"), pragmas={"synchronous": "OFF"})
+
+        with pool.connection() as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+        pool.close()
+
+    def test_database_connection_borrows_from_pool(self, tmp_path: Path) -> None:
+        """Verify DatabaseConnection returns its pooled connection on close()."""
+        pool = ConnectionPool(str(tmp_path / "pool.db"))
+        db = DatabaseConnection(pool=pool)
+        conn = db.connect()
+
+        assert db.db_path == pool.db_path
+        db.close()
+        assert pool.acquire() is conn
+        pool.close()
+
 
 class TestGetConnection:
     """Test cases for get_connection factory function."""
@@ -259,7 +259,7 @@ class TestCircuitBreaker:
         with pytest.raises(ValidationError, match="Circuit breaker is OPEN"):
             cb.call(lambda: "should not execute")
     
-    @patch('trader.error_handling.time.time')
+    @patch('trader.error_handling.time.monotonic')
     def test_circuit_breaker_half_open_after_cooldown(self, mock_time: MagicMock) -> None:
         """Test circuit breaker enters half-open state after timeout."""
         mock_time.side_effect = [0, 100]  # First call, then after timeout
@@ -0,0 +1,396 @@
+"""Tests for the database-backed status tracking in trader.scraper."""
+import gc
+import os
+import sqlite3
+import tempfile
+import threading
+from typing import Iterator, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from trader.database import ConnectionPool
+from trader.scraper import Scraper
+
+
+@pytest.fixture
+def scraper() -> Iterator[Scraper]:
+    """Provide an in-memory Scraper and close it afterwards."""
+    instance = Scraper()
+    yield instance
+    instance.close()
+
+
+class TestScraperConnection:
+    """Test cases for Scraper database connection handling."""
+
+    def test_reuses_single_connection(self, scraper: Scraper) -> None:
+        """Verify every operation runs on the connection opened in __init__."""
+        conn = scraper._db.connect()
+
+        scraper.start_run()
+        scraper.record_failure("boom")
+        scraper.end_run("failed")
+        scraper.get_status()
+
+        assert scraper._db.connect() is conn
+
+    def test_in_memory_state_persists_between_calls(self, scraper: Scraper) -> None:
+        """Verify runs recorded on an in-memory database remain visible."""
+        scraper.start_run()
+        scraper.end_run("completed", items_count=3)
+
+        history = scraper.get_run_history()
+
+        assert len(history) == 1
+        assert history[0]["status"] == "completed"
+        assert history[0]["items_count"] == 3
+
+    def test_close_releases_connection(self) -> None:
+        """Verify close() closes the underlying connection."""
+        scraper = Scraper()
+        scraper.close()
+
+        assert scraper._db.is_connected() is False
+
+    def test_context_manager_closes_connection(self) -> None:
+        """Verify the scraper closes its connection on context exit."""
+        with Scraper() as scraper:
+            scraper.start_run()
+            assert scraper._db.is_connected() is True
+
+        assert scraper._db.is_connected() is False
+
+    def test_file_database_shared_between_instances(self) -> None:
+        """Verify runs written by one Scraper are read by another."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "trader.db")
+
+            with Scraper(db_path) as writer:
+                writer.start_run()
+                writer.end_run("completed")
+
+            with Scraper(db_path) as reader:
+                assert reader.get_status() == "completed"
+
+    def test_pooled_scrapers_share_connections(self) -> None:
+        """Verify Scrapers built on a pool reuse its connections."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pool = ConnectionPool(os.path.join(tmpdir, "trader.db"))
+
+            with Scraper(pool=pool) as writer:
+                writer.start_run()
+                writer.end_run("completed")
+
+            with Scraper(pool=pool) as reader:
+                assert reader.get_status() == "completed"
+
+            assert pool.size == 1
+            pool.close()
+
+    def test_usable_from_other_threads(self, scraper: Scraper) -> None:
+        """Verify a scraper built in one thread can be driven from others."""
+        run_id = scraper.start_run()
+        errors: List[Exception] = []
+
+        def work() -> None:
+            try:
+                for i in range(20):
+                    scraper.record_failure(f"error {i}")
+                scraper.get_status()
+            except Exception as exc:
+                errors.append(exc)
+
+        workers = [threading.Thread(target=work) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        scraper.end_run("failed")
+
+        assert errors == []
+        assert len(scraper.get_run_history()) == 1
+        result = scraper._db.execute(
+            "SELECT COUNT(*) AS count FROM scraper_failures WHERE run_id = ?", (run_id,)
+        )
+        assert result[0]["count"] == 80
+
+    def test_unclosed_pooled_scrapers_return_connections(self) -> None:
+        """Verify collected scrapers hand their connections back to the pool."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pool = ConnectionPool(os.path.join(tmpdir, "trader.db"), max_size=2, timeout=0.1)
+
+            for _ in range(3):
+                scraper = Scraper(pool=pool)
+                scraper.start_run()
+                del scraper
+                gc.collect()
+
+            with Scraper(pool=pool) as reader:
+                assert len(reader.get_run_history()) == 3
+
+            assert pool.size <= 2
+            pool.close()
+
+    def test_file_database_uses_wal_journal(self) -> None:
+        """Verify a file-backed Scraper switches SQLite to WAL mode."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "trader.db")
+
+            with Scraper(db_path) as scraper:
+                journal = scraper._db.execute("PRAGMA journal_mode")
+                synchronous = scraper._db.execute("PRAGMA synchronous")
+                temp_store = scraper._db.execute("PRAGMA temp_store")
+
+            assert journal[0]["journal_mode"] == "wal"
+            assert synchronous[0]["synchronous"] == 1  # NORMAL
+            assert temp_store[0]["temp_store"] == 2  # MEMORY
+
+    def test_pooled_connection_gets_scraper_pragmas(self) -> None:
+        """Verify a connection borrowed from a plain pool is switched to WAL."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pool = ConnectionPool(os.path.join(tmpdir, "trader.db"))
+
+            with Scraper(pool=pool) as scraper:
+                journal = scraper._db.execute("PRAGMA journal_mode")
+                synchronous = scraper._db.execute("PRAGMA synchronous")
+
+            assert journal[0]["journal_mode"] == "wal"
+            assert synchronous[0]["synchronous"] == 1  # NORMAL
+            pool.close()
+
+    def test_creates_lookup_indexes(self, scraper: Scraper) -> None:
+        """Verify the status and history lookups are backed by indexes."""
+        indexes = scraper._db.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%'"
+        )
+        index_names = {idx["name"] for idx in indexes}
+
+        assert "idx_scraper_runs_started_at" in index_names
+        assert "idx_scraper_runs_status" in index_names
+        assert "idx_scraper_failures_occurred_at" in index_names
+        assert "idx_scraper_failures_run_id" in index_names
+
+
+class TestScraperRuns:
+    """Test cases for Scraper run tracking."""
+
+    def test_status_idle_without_runs(self, scraper: Scraper) -> None:
+        """Verify status is 'idle' when no runs are recorded."""
+        assert scraper.get_status() == "idle"
+
+    def test_start_run_returns_id(self, scraper: Scraper) -> None:
+        """Verify start_run returns the new run ID and marks it current."""
+        run_id = scraper.start_run()
+
+        assert isinstance(run_id, int)
+        assert scraper.get_current_run_id() == run_id
+        assert scraper.get_status() == "running"
+
+    def test_end_run_clears_current_run(self, scraper: Scraper) -> None:
+        """Verify end_run records the final status and clears the run ID."""
+        scraper.start_run()
+        scraper.end_run("failed")
+
+        assert scraper.get_current_run_id() is None
+        assert scraper.get_status() == "failed"
+
+    def test_status_cached_within_ttl(self, scraper: Scraper) -> None:
+        """Verify repeated get_status calls within the TTL skip the database."""
+        assert scraper.get_status() == "idle"
+        scraper._db.execute(
+            "INSERT INTO scraper_runs (status, items_count) VALUES ('completed', 0)"
+        )
+
+        assert scraper.get_status() == "idle"
+
+    def test_status_refreshed_after_ttl(self) -> None:
+        """Verify get_status queries again once the TTL has elapsed."""
+        with Scraper(status_ttl=0.0) as scraper:
+            assert scraper.get_status() == "idle"
+            scraper._db.execute(
+                "INSERT INTO scraper_runs (status, items_count) VALUES ('completed', 0)"
+            )
+
+            assert scraper.get_status() == "completed"
+
+    def test_status_running_without_query(self, scraper: Scraper) -> None:
+        """Verify an active run reports 'running' without touching the database."""
+        scraper.start_run()
+
+        with patch.object(scraper._db, "execute") as execute:
+            assert scraper.get_status() == "running"
+
+        execute.assert_not_called()
+
+    def test_end_run_without_run_is_noop(self, scraper: Scraper) -> None:
+        """Verify end_run does nothing when no run is active."""
+        scraper.end_run("completed")
+
+        assert scraper.get_run_history() == []
+
+
+class TestScraperFailures:
+    """Test cases for Scraper failure recording."""
+
+    def test_record_failure_starts_run(self, scraper: Scraper) -> None:
+        """Verify a failure outside a run starts one to attach to."""
+        scraper.record_failure("network down", "warning")
+
+        failures = scraper.get_recent_failures()
+
+        assert scraper.get_current_run_id() is not None
+        assert len(failures) == 1
+        assert failures[0]["error_message"] == "network down"
+        assert failures[0]["level"] == "warning"
+        assert failures[0]["run_id"] == scraper.get_current_run_id()
+
+    def test_get_recent_failures_respects_limit(self, scraper: Scraper) -> None:
+        """Verify get_recent_failures returns at most `limit` records."""
+        scraper.start_run()
+        for i in range(5):
+            scraper.record_failure(f"error {i}")
+
+        assert len(scraper.get_recent_failures(limit=3)) == 3
+
+    def test_failures_buffered_until_batch_size(self) -> None:
+        """Verify failures are written only once the batch fills up."""
+        with Scraper(failure_batch_size=3) as scraper:
+            scraper.start_run()
+            scraper.record_failure("error 1")
+            scraper.record_failure("error 2")
+
+            count_sql = "SELECT COUNT(*) AS count FROM scraper_failures"
+            assert scraper._db.execute(count_sql)[0]["count"] == 0
+
+            scraper.record_failure("error 3")
+
+            assert scraper._db.execute(count_sql)[0]["count"] == 3
+
+    def test_flush_failures_writes_buffer(self, scraper: Scraper) -> None:
+        """Verify flush_failures persists buffered failures on demand."""
+        scraper.start_run()
+        scraper.record_failure("error")
+        scraper.flush_failures()
+
+        result = scraper._db.execute("SELECT COUNT(*) AS count FROM scraper_failures")
+
+        assert result[0]["count"] == 1
+
+    def test_critical_failure_flushes_immediately(self, scraper: Scraper) -> None:
+        """Verify a critical failure persists the buffered failures."""
+        scraper.start_run()
+        scraper.record_failure("minor", "warning")
+        scraper.record_failure("fatal", "critical")
+
+        result = scraper._db.execute("SELECT COUNT(*) AS count FROM scraper_failures")
+
+        assert result[0]["count"] == 2
+
+    def test_end_run_flushes_failures(self, scraper: Scraper) -> None:
+        """Verify ending a run writes its buffered failures."""
+        scraper.start_run()
+        scraper.record_failure("error")
+        scraper.end_run("failed")
+
+        result = scraper._db.execute("SELECT COUNT(*) AS count FROM scraper_failures")
+
+        assert result[0]["count"] == 1
+
+    def test_close_flushes_failures(self) -> None:
+        """Verify close() writes buffered failures before closing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "trader.db")
+
+            scraper = Scraper(db_path)
+            scraper.record_failure("error")
+            scraper.close()
+
+            with Scraper(db_path) as reader:
+                assert len(reader.get_recent_failures()) == 1
+
+    def test_failure_keeps_time_it_was_recorded(self, scraper: Scraper) -> None:
+        """Verify a buffered failure is stamped when recorded, not when flushed."""
+        scraper.start_run()
+        with patch("trader.scraper._utc_timestamp", return_value="2026-01-01 00:00:00"):
+            scraper.record_failure("early")
+            scraper.record_failures([("grouped", "warning")])
+        scraper.end_run("failed")
+
+        failures = scraper.get_recent_failures()
+
+        assert {f["occurred_at"] for f in failures} == {"2026-01-01 00:00:00"}
+
+    def test_unclosed_scraper_flushes_when_collected(self) -> None:
+        """Verify buffered failures are written if close() is never called."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "trader.db")
+
+            scraper = Scraper(db_path)
+            scraper.record_failure("error")
+            assert scraper._finalizer.atexit is True
+            del scraper
+            gc.collect()
+
+            with Scraper(db_path) as reader:
+                assert len(reader.get_recent_failures()) == 1
+
+    def test_end_run_rolls_back_failures_with_status(self, scraper: Scraper) -> None:
+        """Verify a failed status update also discards the flushed failures."""
+        scraper.start_run()
+        scraper.record_failure("error")
+
+        with pytest.raises(sqlite3.IntegrityError):
+            scraper.end_run(None)  # type: ignore[arg-type]
+
+        result = scraper._db.execute("SELECT COUNT(*) AS count FROM scraper_failures")
+        assert result[0]["count"] == 0
+        assert scraper.get_status() == "running"
+
+    def test_record_failures_buffers_group(self) -> None:
+        """Verify record_failures adds every failure to the current run."""
+        with Scraper(failure_batch_size=10) as scraper:
+            run_id = scraper.start_run()
+            scraper.record_failures([("timeout", "warning"), ("bad html", "error")])
+
+            count_sql = "SELECT COUNT(*) AS count FROM scraper_failures"
+            assert scraper._db.execute(count_sql)[0]["count"] == 0
+
+            failures = scraper.get_recent_failures()
+            assert {f["error_message"] for f in failures} == {"timeout", "bad html"}
+            assert {f["run_id"] for f in failures} == {run_id}
+
+    def test_record_failures_empty_does_not_start_run(self, scraper: Scraper) -> None:
+        """Verify an empty group neither starts a run nor writes anything."""
+        scraper.record_failures([])
+
+        assert scraper.get_current_run_id() is None
+        assert scraper.get_run_history() == []
+
+    def test_record_failures_flushes_on_critical(self, scraper: Scraper) -> None:
+        """Verify a critical failure in the group persists the whole group."""
+        scraper.record_failures([("minor", "warning"), ("fatal", "critical")])
+
+        result = scraper._db.execute("SELECT COUNT(*) AS count FROM scraper_failures")
+
+        assert result[0]["count"] == 2
+
+    def test_critical_failure_sends_alert(self, scraper: Scraper) -> None:
+        """Verify a critical failure reaches trader.alert.send_alert."""
+        send_alert = MagicMock()
+
+        with patch("trader.alert.send_alert", send_alert):
+            scraper.record_failure("disk full", "critical")
+
+        send_alert.assert_called_once_with(
+            "Critical scraper failure: disk full", "critical"
+        )
+
+    def test_alert_failure_does_not_raise(self, scraper: Scraper) -> None:
+        """Verify an exception from the alert sender is swallowed."""
+        send_alert = MagicMock(side_effect=RuntimeError("webhook down"))
+
+        with patch("trader.alert.send_alert", send_alert):
+            scraper.record_failure("disk full", "critical")
+
+        assert len(scraper.get_recent_failures()) == 1
@@ -24,12 +24,15 @@ from trader.validators import (
     validate_price,
 )
 from trader.error_handling import (
+    aretry,
     retry,
     CircuitBreaker,
+    CircuitSnapshot,
     CircuitState,
     RetryWithCircuitBreaker,
     ScraperState,
     circuit_breaker,
+    is_unrecoverable_http_error,
 )
 
 __version__ = "0.1.0"
@@ -43,10 +46,13 @@ __all__ = [
     "parse_item",
     "validate_html_structure",
     "validate_price",
+    "aretry",
     "retry",
     "CircuitBreaker",
+    "CircuitSnapshot",
     "CircuitState",
     "RetryWithCircuitBreaker",
     "ScraperState",
     "circuit_breaker",
+    "is_unrecoverable_http_error",
 ]
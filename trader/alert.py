@@ -8,10 +8,30 @@ import os
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session so repeated alerts reuse keep-alive connections
+_session: Optional[requests.Session] = None
+
+
+def _get_session() -> requests.Session:
+    """Get the shared webhook session, creating it on first use.
+
+    Returns:
+        A requests.Session with a small connection pool.
+    """
+    global _session
+    if _session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _session = session
+    return _session
+
 
 def send_alert(message: str, level: str = "error") -> bool:
     """Send an alert notification via webhook and log it.
@@ -43,7 +63,7 @@ def send_alert(message: str, level: str = "error") -> bool:
         return False
 
     try:
-        response = requests.post(
+        response = _get_session().post(
             webhook_url,
             json={
                 "message": message,
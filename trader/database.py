@@ -4,28 +4,231 @@ Provides a DatabaseConnection class for SQLite database operations
 with context manager support.
 """
 
+import os
 import sqlite3
-from typing import Any, Dict, List, Optional, Union
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from contextlib import contextmanager
 
 
+def _apply_pragmas(conn: sqlite3.Connection, pragmas: Optional[Dict[str, Any]]) -> None:
+    """Run connection-level PRAGMA settings on a freshly opened connection.
+
+    Args:
+        conn: The connection to configure.
+        pragmas: Mapping of PRAGMA name to value, e.g. {"synchronous": "NORMAL"}.
+    """
+    for name, value in (pragmas or {}).items():
+        conn.execute(f"PRAGMA {name}={value}")
+
+
+class ConnectionPool:
+    """Thread-safe pool of reusable SQLite connections to one database file.
+
+    Idle connections are handed out most-recently-used first, so a lightly
+    loaded pool keeps reusing a few warm connections while the rest reach
+    idle_timeout and are closed.
+
+    Args:
+        db_path: Path to the SQLite database file. In-memory databases are
+            rejected because each connection would see its own empty database.
+        max_size: Maximum number of open connections. Defaults to
+            2 * cpu_count + 1.
+        min_idle: Number of connections opened up front.
+        idle_timeout: Seconds an unused connection is kept before closing.
+        max_lifetime: Seconds after which a connection is retired.
+        timeout: Seconds acquire() waits for a connection when the pool is full.
+        pragmas: PRAGMA settings applied to every connection the pool opens.
+
+    Raises:
+        ValueError: If db_path is ":memory:".
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        max_size: Optional[int] = None,
+        min_idle: int = 0,
+        idle_timeout: float = 600.0,
+        max_lifetime: float = 1800.0,
+        timeout: float = 30.0,
+        pragmas: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Initialize ConnectionPool and open min_idle connections.
+
+        Args:
+            db_path: Path to the SQLite database file.
+            max_size: Maximum number of open connections.
+            min_idle: Number of connections opened up front.
+            idle_timeout: Seconds an unused connection is kept before closing.
+            max_lifetime: Seconds after which a connection is retired.
+            timeout: Seconds acquire() waits for a connection.
+            pragmas: PRAGMA settings applied to every connection opened.
+        """
+        if db_path == ":memory:":
+            raise ValueError("ConnectionPool requires a file-backed database")
+
+        self.db_path = db_path
+        self.max_size = max_size if max_size is not None else (os.cpu_count() or 1) * 2 + 1
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self.timeout = timeout
+        self.pragmas = pragmas
+
+        self._cond = threading.Condition()
+        self._idle: List[Tuple[sqlite3.Connection, float]] = []
+        self._created: Dict[sqlite3.Connection, float] = {}
+        self._closed = False
+
+        for _ in range(min(min_idle, self.max_size)):
+            conn = self._open()
+            self._idle.append((conn, time.monotonic()))
+
+    @property
+    def size(self) -> int:
+        """Number of open connections, idle or in use."""
+        return len(self._created)
+
+    def _open(self) -> sqlite3.Connection:
+        """Open a new pooled connection and record its creation time."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        _apply_pragmas(conn, self.pragmas)
+        self._created[conn] = time.monotonic()
+        return conn
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        """Close a connection and free its slot. Caller holds the lock."""
+        conn.close()
+        del self._created[conn]
+        self._cond.notify()
+
+    def acquire(self) -> sqlite3.Connection:
+        """Take a connection from the pool, opening one if there is room.
+
+        Returns:
+            A connection that must be handed back with release().
+
+        Raises:
+            RuntimeError: If the pool has been closed.
+            TimeoutError: If no connection frees up within timeout seconds.
+        """
+        deadline = time.monotonic() + self.timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("ConnectionPool is closed")
+
+                while self._idle:
+                    conn, idle_since = self._idle.pop()
+                    now = time.monotonic()
+                    if (
+                        now - idle_since > self.idle_timeout
+                        or now - self._created[conn] > self.max_lifetime
+                    ):
+                        self._discard(conn)
+                        continue
+                    return conn
+
+                if len(self._created) < self.max_size:
+                    return self._open()
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"No pooled connection available within {self.timeout}s"
+                    )
+                self._cond.wait(remaining)
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool.
+
+        Any open transaction is rolled back. Connections past max_lifetime,
+        or released after close(), are closed instead of being kept.
+
+        Args:
+            conn: A connection previously returned by acquire().
+        """
+        with self._cond:
+            if conn.in_transaction:
+                conn.rollback()
+
+            now = time.monotonic()
+            if self._closed or now - self._created[conn] > self.max_lifetime:
+                self._discard(conn)
+            else:
+                self._idle.append((conn, now))
+                self._cond.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for the duration of a with block.
+
+        Yields:
+            A pooled connection, released when the block exits.
+        """
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        """Close idle connections and stop handing out new ones.
+
+        Connections still in use are closed when they are released.
+        """
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                conn, _ = self._idle.pop()
+                self._discard(conn)
+            self._cond.notify_all()
+
+
 class DatabaseConnection:
     """Manages SQLite database connections.
 
     This class provides a high-level interface for SQLite database operations
     with support for connection pooling and context manager protocol.
 
+    When a ConnectionPool is given, connect() borrows a connection from it
+    and close() hands the connection back instead of closing it.
+
     Args:
         db_path: Path to the SQLite database file. Defaults to ":memory:".
+        pool: Optional ConnectionPool to borrow the connection from.
+        pragmas: Optional PRAGMA settings applied when the connection opens.
+        check_same_thread: Passed to sqlite3.connect. Set it to False to use
+            the connection from other threads; callers must then serialize
+            access themselves.
     """
 
-    def __init__(self, db_path: str = ":memory:") -> None:
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        pool: Optional[ConnectionPool] = None,
+        pragmas: Optional[Dict[str, Any]] = None,
+        check_same_thread: bool = True
+    ) -> None:
         """Initialize DatabaseConnection with database path.
 
         Args:
-            db_path: Path to the SQLite database file.
+            db_path: Path to the SQLite database file. Ignored when pool
+                is given; the pool's path is used instead.
+            pool: Optional ConnectionPool to borrow the connection from.
+            pragmas: Optional mapping of PRAGMA name to value applied when
+                the connection opens. A connection borrowed from a pool gets
+                them each time it is borrowed, on top of the pool's own
+                pragmas; they stay set on it after it is released.
+            check_same_thread: Whether only the opening thread may use the
+                connection. Pooled connections are always shareable.
         """
-        self.db_path = db_path
+        self._pool = pool
+        self.db_path = pool.db_path if pool is not None else db_path
+        self.pragmas = pragmas
+        self.check_same_thread = check_same_thread
         self._connection: Optional[sqlite3.Connection] = None
 
     def connect(self) -> sqlite3.Connection:
@@ -38,18 +241,28 @@ class DatabaseConnection:
             sqlite3.Error: If connection fails.
         """
         if self._connection is None:
-            self._connection = sqlite3.connect(self.db_path)
-            # Enable row factory for dictionary-like access
-            self._connection.row_factory = sqlite3.Row
+            if self._pool is not None:
+                self._connection = self._pool.acquire()
+            else:
+                self._connection = sqlite3.connect(
+                    self.db_path, check_same_thread=self.check_same_thread
+                )
+                # Enable row factory for dictionary-like access
+                self._connection.row_factory = sqlite3.Row
+            _apply_pragmas(self._connection, self.pragmas)
         return self._connection
 
     def close(self) -> None:
         """Close the database connection.
 
-        This method safely closes the connection if it exists.
+        This method safely closes the connection if it exists. A pooled
+        connection is released back to its pool instead.
         """
         if self._connection is not None:
-            self._connection.close()
+            if self._pool is not None:
+                self._pool.release(self._connection)
+            else:
+                self._connection.close()
             self._connection = None
 
     def execute(
@@ -89,6 +302,80 @@ class DatabaseConnection:
         cursor.close()
         return result
 
+    def execute_insert(
+        self,
+        query: str,
+        parameters: Optional[Union[tuple, Dict[str, Any]]] = None
+    ) -> Optional[int]:
+        """Execute an INSERT statement and return the new row's ID.
+
+        Args:
+            query: The INSERT statement to execute.
+            parameters: Optional parameters for parameterized queries.
+
+        Returns:
+            The rowid of the inserted row, or None if no row was inserted.
+
+        Raises:
+            sqlite3.Error: If query execution fails.
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+
+        if parameters is None:
+            cursor.execute(query)
+        else:
+            cursor.execute(query, parameters)
+
+        conn.commit()
+        row_id = cursor.lastrowid
+        cursor.close()
+        return row_id
+
+    def executemany(
+        self,
+        query: str,
+        seq_of_parameters: Iterable[Union[tuple, Dict[str, Any]]]
+    ) -> None:
+        """Execute a SQL statement once per parameter set in one transaction.
+
+        Args:
+            query: The SQL statement to execute.
+            seq_of_parameters: Parameters for each execution.
+
+        Raises:
+            sqlite3.Error: If execution fails. The transaction is rolled back.
+        """
+        conn = self.connect()
+        try:
+            conn.executemany(query, seq_of_parameters)
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Run several statements as one transaction.
+
+        Statements executed on the yielded cursor are committed together
+        when the block exits, or rolled back if it raises.
+
+        Yields:
+            A cursor on the shared connection.
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+        finally:
+            cursor.close()
+
     def __enter__(self) -> "DatabaseConnection":
         """Enter context manager.
 
@@ -1,8 +1,14 @@
 """Error handling utilities with retry decorator and circuit breaker."""
+import asyncio
+import inspect
+import math
+import random
 import time
 import functools
 import threading
-from typing import Callable, Any, TypeVar, Optional, Tuple, Type, Union, List
+from typing import (
+    Callable, Any, Dict, Hashable, MutableMapping, NamedTuple, TypeVar, Optional, Tuple, Type, Union, List
+)
 from enum import Enum, auto
 from .exceptions import ValidationError, MaxRetriesExceededError, CircuitBreakerOpenError
 
@@ -21,6 +27,13 @@ class CircuitState(Enum):
 ScraperState = CircuitState
 
 
+class CircuitSnapshot(NamedTuple):
+    """Consistent view of a circuit breaker's state and counters."""
+    state: CircuitState
+    failure_count: int
+    last_failure_time: Optional[float]
+
+
 class CircuitBreaker:
     """Circuit breaker pattern implementation with thread-safety."""
     
@@ -39,46 +52,71 @@ class CircuitBreaker:
         self._last_failure_time: Optional[float] = None
         self._lock = threading.Lock()
     
+    # Single attribute loads are atomic, so the read-only properties skip
+    # the lock; it only guards multi-field transitions.
+    
     @property
     def state(self) -> CircuitState:
-        """Get current circuit state (thread-safe)."""
-        with self._lock:
-            return self._state
+        """Get current circuit state."""
+        return self._state
     
     @property
     def failure_count(self) -> int:
-        """Get current failure count (thread-safe)."""
-        with self._lock:
-            return self._failure_count
+        """Get current failure count."""
+        return self._failure_count
     
     @property
     def last_failure_time(self) -> Optional[float]:
-        """Get last failure time (thread-safe)."""
+        """Get last failure time as a time.monotonic() reading."""
+        return self._last_failure_time
+    
+    def snapshot(self) -> CircuitSnapshot:
+        """Read state, failure count and last failure time together.
+
+        Returns:
+            The three values captured under a single lock acquisition, so
+            they always describe the same moment.
+        """
+        with self._lock:
+            return CircuitSnapshot(self._state, self._failure_count, self._last_failure_time)
+    
+    def is_open(self) -> bool:
+        """Check whether calls would currently be rejected (thread-safe).
+
+        Returns:
+            True if the circuit is OPEN and the recovery timeout has not
+            yet elapsed, False otherwise.
+        """
         with self._lock:
-            return self._last_failure_time
+            return self._state is CircuitState.OPEN and not self._should_attempt_reset()
     
     def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
         """Call a function with circuit breaker protection."""
-        with self._lock:
-            if self._state == CircuitState.OPEN:
-                if self._should_attempt_reset():
-                    self._state = CircuitState.HALF_OPEN
-                else:
-                    raise CircuitBreakerOpenError(f"Circuit breaker is OPEN - service unavailable")
+        # Fast path: a CLOSED circuit admits calls without taking the lock
+        if self._state is not CircuitState.CLOSED:
+            with self._lock:
+                if self._state is CircuitState.OPEN:
+                    if self._should_attempt_reset():
+                        self._state = CircuitState.HALF_OPEN
+                    else:
+                        raise CircuitBreakerOpenError(f"Circuit breaker is OPEN - service unavailable")
         
         try:
             result = func(*args, **kwargs)
-            self._on_success()
-            return result
-        except self.expected_exception as e:
+        except self.expected_exception:
             self._on_failure()
-            raise e
+            raise
+        
+        # A success on a clean CLOSED circuit has nothing to reset
+        if self._failure_count or self._state is not CircuitState.CLOSED:
+            self._on_success()
+        return result
     
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to try reset."""
         if self._last_failure_time is None:
             return True
-        return (time.time() - self._last_failure_time) >= self.recovery_timeout
+        return (time.monotonic() - self._last_failure_time) >= self.recovery_timeout
     
     def _on_success(self) -> None:
         """Handle successful call."""
@@ -90,7 +128,7 @@ class CircuitBreaker:
         """Handle failed call."""
         with self._lock:
             self._failure_count += 1
-            self._last_failure_time = time.time()
+            self._last_failure_time = time.monotonic()
             
             if self._failure_count >= self.failure_threshold:
                 self._state = CircuitState.OPEN
@@ -141,67 +179,266 @@ def circuit_breaker(
     return decorator
 
 
+class _Stop(Enum):
+    """Why retry() stops after a failed attempt."""
+    GIVE_UP = auto()  # giveup() matched; re-raise the original exception
+    EXHAUSTED = auto()  # no attempts or time budget left
+
+
+# 4xx statuses that can still succeed on a later attempt
+_RETRYABLE_CLIENT_STATUSES = frozenset({408, 425, 429})
+
+
+def is_unrecoverable_http_error(exc: Exception) -> bool:
+    """
+    Check whether an exception is an HTTP client error that retrying won't fix.
+    
+    Reads the status from ``exc.code`` (urllib) or ``exc.response.status_code``
+    (requests). 4xx statuses are unrecoverable except 408, 425 and 429.
+    
+    Args:
+        exc: The exception raised by the failed attempt
+        
+    Returns:
+        True if the exception carries a non-retryable 4xx status
+    """
+    status = getattr(exc, "code", None)
+    if not isinstance(status, int):
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    if not isinstance(status, int):
+        return False
+    return 400 <= status < 500 and status not in _RETRYABLE_CLIENT_STATUSES
+
+
 def retry(
     max_attempts: int = 3,
     exceptions: Union[Tuple[Type[Exception], ...], List[Type[Exception]]] = (Exception,),
     delay: float = 1.0,
     backoff: float = 2.0,
+    max_delay: Optional[float] = None,
+    jitter: float = 0.0,
+    max_elapsed: Optional[float] = None,
+    giveup: Optional[Callable[[Exception], bool]] = None,
+    idempotency_key: Optional[Callable[..., Hashable]] = None,
+    completed: Optional[MutableMapping[Any, Any]] = None,
 ) -> Callable[[F], F]:
     """
     Retry decorator with exponential backoff.
     
+    Coroutine functions get an async wrapper that waits with
+    ``asyncio.sleep``, so retries don't block the event loop.
+    
+    If a caught exception carries a numeric ``retry_after`` attribute
+    (seconds, e.g. parsed from an HTTP 429 ``Retry-After`` header), that
+    wait is used for the next sleep instead of the backoff delay. Negative
+    values are treated as 0; NaN and infinity are ignored.
+    
     Args:
         max_attempts: Maximum number of retry attempts
         exceptions: Tuple of exception types to catch and retry on
         delay: Initial delay between retries (seconds)
         backoff: Multiplier for delay after each retry
+        max_delay: Upper bound for any single sleep (seconds), or None
+        jitter: Fraction (0.0-1.0) of each backoff delay to randomize;
+            1.0 is "full jitter", 0.0 keeps the schedule deterministic
+        max_elapsed: Total time budget (seconds, monotonic clock); no
+            retry is started if its sleep would overrun it, or None
+        giveup: Predicate called with each caught exception; if it returns
+            True the exception is re-raised at once without further retries
+            (e.g. ``is_unrecoverable_http_error``)
+        idempotency_key: Function called with the wrapped function's
+            arguments to name the action; once a call with a given key
+            succeeds, later calls with that key return the stored result.
+            The key is only checked when a call starts, so retries within
+            that call still re-invoke the function after a failed attempt
+            that may already have had its side effect
+        completed: Mapping of key to result, required with idempotency_key.
+            The caller owns its size and scope, e.g. a bounded LRU mapping
+            or a store shared between processes
         
     Returns:
         Decorated function with retry logic
         
     Raises:
+        ValueError: If jitter is outside 0.0-1.0, or idempotency_key is
+            given without completed
         MaxRetriesExceededError: When all retry attempts are exhausted
     """
+    if not 0.0 <= jitter <= 1.0:
+        raise ValueError(f"jitter must be between 0.0 and 1.0, got {jitter!r}")
+    if idempotency_key is not None and completed is None:
+        raise ValueError("idempotency_key requires a completed mapping")
+    
     # Convert list to tuple if needed
     if isinstance(exceptions, list):
         exceptions = tuple(exceptions)
     
+    # Private RNG so concurrent retries don't contend on the global one
+    rng = random.Random()
+    
+    # The backoff schedule is fixed per decoration, so compute it once. It
+    # stops growing at max_delay; later attempts reuse the last entry
+    schedule: List[float] = []
+    wait = delay
+    for _ in range(max(max_attempts - 1, 0)):
+        if max_delay is not None and wait >= max_delay:
+            schedule.append(max_delay)
+            break
+        schedule.append(wait)
+        wait *= backoff
+    
     def decorator(func: F) -> F:
+        results: MutableMapping[Any, Any] = completed if completed is not None else {}
+        
+        def next_wait(e: Exception, attempt: int, start: float) -> Optional[float]:
+            """Return the sleep before the next attempt, or None to stop."""
+            if attempt == max_attempts - 1:
+                return None
+            
+            # Prefer the wait the server asked for, if any
+            retry_after = getattr(e, "retry_after", None)
+            if isinstance(retry_after, (int, float)) and math.isfinite(retry_after):
+                # A Retry-After date in the past means "retry now"
+                wait = max(0.0, float(retry_after))
+            else:
+                wait = schedule[min(attempt, len(schedule) - 1)]
+                if jitter:
+                    wait = rng.uniform(wait * (1.0 - jitter), wait)
+            if max_delay is not None:
+                wait = min(wait, max_delay)
+            
+            if max_elapsed is not None and time.monotonic() - start + wait > max_elapsed:
+                return None
+            return wait
+        
+        # The sync and async wrappers share everything except how func is
+        # invoked and how they sleep, so the bookkeeping lives here
+        def call_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[Hashable]:
+            """Return the idempotency key for a call, or None if keys are off."""
+            return idempotency_key(*args, **kwargs) if idempotency_key else None
+        
+        # Stopping is decided here but raised in the wrappers' except blocks,
+        # so a bare raise keeps the original traceback free of helper frames
+        def after_failure(e: Exception, attempt: int, start: float) -> Union[float, _Stop]:
+            """Return the sleep before the next attempt, or why to stop."""
+            if giveup is not None and giveup(e):
+                return _Stop.GIVE_UP
+            wait = next_wait(e, attempt, start)
+            return _Stop.EXHAUSTED if wait is None else wait
+        
+        def exhausted(attempts: int) -> MaxRetriesExceededError:
+            """Build the error raised once no attempts are left."""
+            return MaxRetriesExceededError(f"Function failed after {attempts} attempts")
+        
+        def after_success(key: Optional[Hashable], result: Any) -> Any:
+            """Store the result under its idempotency key and return it."""
+            if key is not None:
+                results[key] = result
+            return result
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                key = call_key(args, kwargs)
+                if key is not None and key in results:
+                    return results[key]
+                
+                start = time.monotonic()
+                for attempt in range(max_attempts):
+                    try:
+                        result = await func(*args, **kwargs)
+                    except exceptions as e:
+                        wait = after_failure(e, attempt, start)
+                        if wait is _Stop.GIVE_UP:
+                            raise
+                        if wait is _Stop.EXHAUSTED:
+                            raise exhausted(attempt + 1) from e
+                        # Yield to the event loop so other tasks keep running
+                        await asyncio.sleep(wait)
+                    else:
+                        return after_success(key, result)
+                
+                # Only reached when max_attempts < 1 and func was never called
+                raise exhausted(0)
+            
+            return async_wrapper  # type: ignore
+        
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            current_delay = delay
-            last_exception: Optional[Exception] = None
+            key = call_key(args, kwargs)
+            if key is not None and key in results:
+                return results[key]
             
+            start = time.monotonic()
             for attempt in range(max_attempts):
                 try:
-                    return func(*args, **kwargs)
+                    result = func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-                    if attempt < max_attempts - 1:
-                        time.sleep(current_delay)
-                        current_delay *= backoff
+                    wait = after_failure(e, attempt, start)
+                    if wait is _Stop.GIVE_UP:
+                        raise
+                    if wait is _Stop.EXHAUSTED:
+                        raise exhausted(attempt + 1) from e
+                    time.sleep(wait)
+                else:
+                    return after_success(key, result)
             
-            # All retries exhausted - raise MaxRetriesExceededError
-            error_msg = f"Function failed after {max_attempts} attempts"
-            raise MaxRetriesExceededError(error_msg) from last_exception
+            # Only reached when max_attempts < 1 and func was never called
+            raise exhausted(0)
         
         return wrapper  # type: ignore
     
     return decorator
 
 
+def aretry(*args: Any, **kwargs: Any) -> Callable[[F], F]:
+    """
+    Retry decorator for coroutine functions.
+    
+    Takes the same arguments as ``retry``, but refuses plain functions at
+    decoration time, so an async call site can't silently end up with the
+    blocking ``time.sleep`` wrapper.
+    
+    Returns:
+        Decorated coroutine function with retry logic
+        
+    Raises:
+        TypeError: If the decorated function is not a coroutine function
+    """
+    retry_decorator = retry(*args, **kwargs)
+    
+    def decorator(func: F) -> F:
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError(f"aretry requires a coroutine function, got {func!r}")
+        return retry_decorator(func)
+    
+    return decorator
+
+
 class RetryWithCircuitBreaker:
-    """Combines retry and circuit breaker patterns."""
+    """Combines retry and circuit breaker patterns.
+    
+    Retries back off by doubling ``delay``. With ``decorrelated_jitter``
+    each wait is instead drawn from ``uniform(delay, 3 * previous_wait)``,
+    so callers that failed together spread their retries out rather than
+    hitting a recovering service in lockstep. ``max_delay`` caps either
+    schedule.
+    """
     
     def __init__(
         self,
         max_attempts: int = 3,
         delay: float = 1.0,
         failure_threshold: int = 5,
-        recovery_timeout: float = 60.0
+        recovery_timeout: float = 60.0,
+        max_delay: Optional[float] = None,
+        decorrelated_jitter: bool = False
     ):
         self.max_attempts = max_attempts
         self.delay = delay
+        self.max_delay = max_delay
+        self.decorrelated_jitter = decorrelated_jitter
+        self._rng = random.Random()
         self.circuit_breaker = CircuitBreaker(
             failure_threshold=failure_threshold,
             recovery_timeout=recovery_timeout
@@ -211,21 +448,27 @@ class RetryWithCircuitBreaker:
         """Apply both retry and circuit breaker to a function."""
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Fail fast: an open circuit would reject every attempt anyway
+            if self.circuit_breaker.is_open():
+                raise CircuitBreakerOpenError("Circuit breaker is OPEN - service unavailable")
+            
             current_delay = self.delay
-            last_exception: Optional[Exception] = None
             
             for attempt in range(self.max_attempts):
                 try:
                     return self.circuit_breaker.call(func, *args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    if attempt < self.max_attempts - 1:
-                        time.sleep(current_delay)
+                except Exception:
+                    # Re-raise as-is on the last attempt, or once the circuit
+                    # has opened - further attempts would only be rejected
+                    if attempt == self.max_attempts - 1 or self.circuit_breaker.is_open():
+                        raise
+                    time.sleep(current_delay)
+                    if self.decorrelated_jitter:
+                        current_delay = self._rng.uniform(self.delay, current_delay * 3.0)
+                    else:
                         current_delay *= 2.0
-            
-            # All retries exhausted - re-raise the last exception
-            if last_exception is not None:
-                raise last_exception
+                    if self.max_delay is not None:
+                        current_delay = min(current_delay, self.max_delay)
             
             raise MaxRetriesExceededError(
                 f"Function failed after {self.max_attempts} attempts"
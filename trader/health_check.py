@@ -9,6 +9,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional, Literal
 
 from trader.database import DatabaseConnection
+from trader.schema import create_tables
 
 
 ScraperHealthStatusType = Literal["ok", "error", "idle"]
@@ -89,25 +90,16 @@ def check_scraper_status(db_path: str = ":memory:") -> Dict[str, Any]:
 
 def _check_scraper_status_impl(db_path: str) -> Dict[str, Any]:
     """Internal implementation for scraper status check."""
-    from trader.schema import create_tables
-    
     db = DatabaseConnection(db_path)
 
     try:
         # Ensure tables exist
         create_tables(db)
         
-        # Get the most recent scraper run
-        latest_run_result = db.execute(
-            """SELECT started_at, status
-               FROM scraper_runs
-               ORDER BY started_at DESC
-               LIMIT 1"""
-        )
-
-        # Get last 5 runs to count consecutive failures (starting from most recent)
+        # Get last 5 runs, most recent first; the first row is the latest run
+        # and the rest are used to count consecutive failures
         recent_runs = db.execute(
-            """SELECT status
+            """SELECT started_at, status
                FROM scraper_runs
                ORDER BY started_at DESC
                LIMIT 5"""
@@ -126,9 +118,9 @@ def _check_scraper_status_impl(db_path: str) -> Dict[str, Any]:
         last_run_at: Optional[str] = None
         last_run_status: Optional[str] = None
 
-        if latest_run_result:
-            last_run_at = latest_run_result[0]["started_at"]
-            last_run_status = latest_run_result[0]["status"]
+        if recent_runs:
+            last_run_at = recent_runs[0]["started_at"]
+            last_run_status = recent_runs[0]["status"]
 
         # Determine overall status
         status: ScraperHealthStatusType = "ok"
@@ -202,8 +194,6 @@ def check_recent_failures(db_path: str = ":memory:") -> Dict[str, Any]:
 
 def _check_recent_failures_impl(db_path: str) -> Dict[str, Any]:
     """Internal implementation for recent failures check."""
-    from trader.schema import create_tables
-
     db = DatabaseConnection(db_path)
 
     try:
@@ -216,32 +206,19 @@ def _check_recent_failures_impl(db_path: str) -> Dict[str, Any]:
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=24)
         cutoff_str = cutoff_time.strftime("%Y-%m-%d %H:%M:%S")
 
-        # Get total failures in last 24h
-        total_result = db.execute(
-            """SELECT COUNT(*) as count
+        # Get total, critical and warning failure counts in last 24h in one pass
+        counts_result = db.execute(
+            """SELECT COUNT(*) as total,
+                      COUNT(CASE WHEN level = 'critical' THEN 1 END) as critical,
+                      COUNT(CASE WHEN level = 'warning' THEN 1 END) as warning
                FROM scraper_failures
                WHERE occurred_at >= ?""",
             (cutoff_str,)
         )
-        total_24h = total_result[0]["count"] if total_result else 0
-
-        # Get critical failures count
-        critical_result = db.execute(
-            """SELECT COUNT(*) as count
-               FROM scraper_failures
-               WHERE occurred_at >= ? AND level = 'critical'""",
-            (cutoff_str,)
-        )
-        critical_24h = critical_result[0]["count"] if critical_result else 0
-
-        # Get warning failures count
-        warning_result = db.execute(
-            """SELECT COUNT(*) as count
-               FROM scraper_failures
-               WHERE occurred_at >= ? AND level = 'warning'""",
-            (cutoff_str,)
-        )
-        warning_24h = warning_result[0]["count"] if warning_result else 0
+        counts = counts_result[0] if counts_result else {}
+        total_24h = counts.get("total", 0)
+        critical_24h = counts.get("critical", 0)
+        warning_24h = counts.get("warning", 0)
 
         # Get top 5 errors grouped by first 50 chars of message
         top_errors_result = db.execute(
@@ -15,6 +15,8 @@ Example:
     1
 """
 
+import hashlib
+import logging
 from typing import Any, Dict, List, Union
 
 from bs4 import BeautifulSoup
@@ -149,7 +151,6 @@ class ItemParser:
             item['name'] = element.get_text(strip=True)
 
         if 'item_hash' not in item and 'name' in item:
-            import hashlib
             item['item_hash'] = hashlib.md5(item['name'].encode()).hexdigest()
 
         return item if item else None
@@ -14,6 +14,9 @@ def create_tables(db: DatabaseConnection) -> None:
     - scraper_runs: Tracks scraper execution runs
     - scraper_failures: Records failures during scraping
 
+    Indexes on run start time, run status, failure time and failure run
+    are created too.
+
     Args:
         db: DatabaseConnection instance to use.
     """
@@ -40,6 +43,24 @@ def create_tables(db: DatabaseConnection) -> None:
         )"""
     )
 
+    # Indexes for the latest-run, status, recent-failure and per-run lookups
+    db.execute(
+        """CREATE INDEX IF NOT EXISTS idx_scraper_runs_started_at
+           ON scraper_runs(started_at DESC)"""
+    )
+    db.execute(
+        """CREATE INDEX IF NOT EXISTS idx_scraper_runs_status
+           ON scraper_runs(status)"""
+    )
+    db.execute(
+        """CREATE INDEX IF NOT EXISTS idx_scraper_failures_occurred_at
+           ON scraper_failures(occurred_at DESC)"""
+    )
+    db.execute(
+        """CREATE INDEX IF NOT EXISTS idx_scraper_failures_run_id
+           ON scraper_failures(run_id)"""
+    )
+
 
 def drop_tables(db: DatabaseConnection) -> None:
     """Drop all application tables.
@@ -4,11 +4,95 @@ Provides a Scraper class that tracks its execution status in the database
 and sends alerts on critical failures.
 """
 
-from typing import Any, Optional
-
-from trader.database import DatabaseConnection
+import functools
+import sqlite3
+import threading
+import time
+import weakref
+from datetime import datetime, timezone
+from types import ModuleType
+from typing import Any, Iterable, List, Optional, Tuple
+
+from trader.database import ConnectionPool, DatabaseConnection
 from trader.schema import create_tables
 
+# WAL keeps status reads from blocking on run/failure writes, and NORMAL sync
+# is durable in WAL mode with one fsync per checkpoint. Temp tables and sort
+# spills stay in memory, and reads go through a 256 MiB memory map.
+_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "mmap_size": 268435456,
+}
+
+# Statement text is kept in module constants so every call hands sqlite3 the
+# same string and hits the connection's prepared-statement cache.
+_SQL_INSERT_RUN = (
+    "INSERT INTO scraper_runs (status, items_count) VALUES ('running', 0)"
+)
+_SQL_UPDATE_END = """UPDATE scraper_runs
+   SET status = ?, items_count = ?, ended_at = CURRENT_TIMESTAMP
+   WHERE id = ?"""
+_SQL_INSERT_FAILURE = """INSERT INTO scraper_failures
+   (run_id, error_message, level, occurred_at)
+   VALUES (?, ?, ?, ?)"""
+_SQL_SELECT_LAST_STATUS = """SELECT status FROM scraper_runs
+   ORDER BY started_at DESC
+   LIMIT 1"""
+_SQL_SELECT_RUN_HISTORY = """SELECT * FROM scraper_runs
+   ORDER BY started_at DESC
+   LIMIT ?"""
+_SQL_SELECT_RECENT_FAILURES = """SELECT * FROM scraper_failures
+   ORDER BY occurred_at DESC
+   LIMIT ?"""
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time in SQLite's CURRENT_TIMESTAMP format."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _flush_and_close(
+    db: DatabaseConnection, buffer: List[Tuple[Optional[int], str, str, str]]
+) -> None:
+    """Write buffered failures and release the connection of an unclosed Scraper.
+
+    Registered with weakref.finalize, so it must not reference the Scraper.
+    A pooled connection goes back to its pool; otherwise it is closed.
+
+    Args:
+        db: The scraper's database connection.
+        buffer: The scraper's pending failure rows.
+    """
+    if not db.is_connected():
+        return
+    if buffer:
+        try:
+            db.executemany(_SQL_INSERT_FAILURE, buffer)
+            buffer.clear()
+        except sqlite3.Error:
+            pass  # Nothing useful to do with the error at interpreter exit
+    db.close()
+
+
+@functools.lru_cache(maxsize=None)
+def _alert_module() -> Optional[ModuleType]:
+    """Import trader.alert once.
+
+    The import is deferred so the scraper works without the alerting
+    dependencies installed. The module rather than send_alert is cached,
+    so patches of trader.alert.send_alert still take effect.
+
+    Returns:
+        The trader.alert module, or None if it cannot be imported.
+    """
+    try:
+        from trader import alert
+    except ImportError:
+        return None
+    return alert
+
 
 class Scraper:
     """Scraper with database-backed status tracking.
@@ -16,40 +100,111 @@ class Scraper:
     This class handles web scraping with automatic tracking of
     execution runs and failures in the database.
 
+    A single database connection is opened on construction and reused
+    by every method; call close() (or use the scraper as a context
+    manager) to release it. Scrapers sharing a ConnectionPool borrow
+    their connection from it and hand it back on close().
+
+    Failures are buffered in memory and written in batches. Each failure
+    keeps the time it was recorded, not the time it was written. The buffer
+    is flushed when it reaches failure_batch_size, on critical failures,
+    when a run ends, before failures are read back and on close(). A scraper
+    that is never closed flushes and releases its connection when it is
+    garbage collected or when the interpreter exits.
+
+    get_status() results are cached for status_ttl seconds; starting or
+    ending a run through this instance invalidates the cache.
+
+    A scraper may be shared between threads. Its connection is opened with
+    check_same_thread=False and every database access is serialized by an
+    internal lock.
+
     Attributes:
         db_path: Path to the SQLite database file.
+        failure_batch_size: Number of buffered failures that triggers a flush.
+        status_ttl: Seconds a get_status() result is reused.
         _current_run_id: ID of the current scraper run (if active).
     """
 
-    def __init__(self, db_path: str = ":memory:") -> None:
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        failure_batch_size: int = 64,
+        status_ttl: float = 1.0,
+        pool: Optional[ConnectionPool] = None,
+    ) -> None:
         """Initialize Scraper with database path.
 
         Args:
-            db_path: Path to the SQLite database file.
+            db_path: Path to the SQLite database file. Ignored when pool
+                is given.
+            failure_batch_size: Number of buffered failures that triggers a flush.
+            status_ttl: Seconds a get_status() result is reused.
+            pool: Optional ConnectionPool to borrow the connection from.
+                The scraper's pragmas are applied to the borrowed connection.
         """
-        self.db_path = db_path
+        self.failure_batch_size = failure_batch_size
+        self.status_ttl = status_ttl
+        self._status_cache: Optional[Tuple[float, str]] = None
         self._current_run_id: Optional[int] = None
+        self._failure_buffer: List[Tuple[Optional[int], str, str, str]] = []
+        self._lock = threading.RLock()
+        self._db = DatabaseConnection(
+            db_path, pool=pool, pragmas=_PRAGMAS, check_same_thread=False
+        )
+        self.db_path = self._db.db_path
+        create_tables(self._db)
+        self._finalizer = weakref.finalize(
+            self, _flush_and_close, self._db, self._failure_buffer
+        )
+
+    def close(self) -> None:
+        """Flush buffered failures and close the database connection."""
+        with self._lock:
+            if self._db.is_connected():
+                self.flush_failures()
+            self._finalizer.detach()
+            self._db.close()
+
+    def __enter__(self) -> "Scraper":
+        """Enter context manager.
+
+        Returns:
+            The Scraper instance.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[Any]
+    ) -> None:
+        """Exit context manager and close the database connection.
 
-    def _get_db(self) -> DatabaseConnection:
-        """Get a database connection with tables created."""
-        db = DatabaseConnection(self.db_path)
-        create_tables(db)
-        return db
+        Args:
+            exc_type: Exception type if an exception occurred.
+            exc_val: Exception value if an exception occurred.
+            exc_tb: Exception traceback if an exception occurred.
+        """
+        self.close()
 
     def start_run(self) -> int:
         """Start a new scraper run and return its ID.
 
         Returns:
             The ID of the newly created run.
+
+        Raises:
+            sqlite3.DatabaseError: If the insert did not report a row ID.
         """
-        db = self._get_db()
-        db.execute(
-            "INSERT INTO scraper_runs (status, items_count) VALUES ('running', 0)"
-        )
-        result = db.execute("SELECT last_insert_rowid() as id")
-        self._current_run_id = result[0]["id"]
-        db.close()
-        return self._current_run_id
+        with self._lock:
+            run_id = self._db.execute_insert(_SQL_INSERT_RUN)
+            if run_id is None:
+                raise sqlite3.DatabaseError("scraper_runs insert returned no row ID")
+            self._current_run_id = run_id
+            self._status_cache = None
+            return run_id
 
     def end_run(self, status: str = "completed", items_count: int = 0) -> None:
         """End the current scraper run.
@@ -58,18 +213,21 @@ class Scraper:
             status: Final status ('completed' or 'failed').
             items_count: Number of items scraped.
         """
-        if self._current_run_id is None:
-            return
-
-        db = self._get_db()
-        db.execute(
-            """UPDATE scraper_runs 
-               SET status = ?, items_count = ?, ended_at = CURRENT_TIMESTAMP
-               WHERE id = ?""",
-            (status, items_count, self._current_run_id),
-        )
-        db.close()
-        self._current_run_id = None
+        with self._lock:
+            if self._current_run_id is None:
+                return
+
+            # Buffered failures and the final status commit together
+            with self._db.transaction() as cursor:
+                if self._failure_buffer:
+                    cursor.executemany(_SQL_INSERT_FAILURE, self._failure_buffer)
+                cursor.execute(
+                    _SQL_UPDATE_END,
+                    (status, items_count, self._current_run_id),
+                )
+            self._failure_buffer.clear()
+            self._current_run_id = None
+            self._status_cache = None
 
     def record_failure(self, error_message: str, level: str = "error") -> None:
         """Record a failure during scraping.
@@ -78,31 +236,82 @@ class Scraper:
             error_message: The error message.
             level: Failure level ('warning', 'error', or 'critical').
         """
-        # Ensure we have a run to associate with
-        if self._current_run_id is None:
-            self.start_run()
-
-        db = self._get_db()
-        db.execute(
-            """INSERT INTO scraper_failures (run_id, error_message, level)
-               VALUES (?, ?, ?)""",
-            (self._current_run_id, error_message, level),
-        )
-        db.close()
+        with self._lock:
+            # Ensure we have a run to associate with
+            if self._current_run_id is None:
+                self.start_run()
+
+            self._failure_buffer.append(
+                (self._current_run_id, error_message, level, _utc_timestamp())
+            )
+
+            # Critical failures are persisted immediately and alerted on
+            if level == "critical" or len(self._failure_buffer) >= self.failure_batch_size:
+                self.flush_failures()
 
-        # Send alert for critical failures
+        # Alert outside the lock so a slow webhook doesn't stall other threads
         if level == "critical":
             self._send_critical_alert(error_message)
 
+    def record_failures(self, failures: Iterable[Tuple[str, str]]) -> None:
+        """Record several failures at once.
+
+        The failures join the buffer together, so at most one batched insert
+        is issued for the whole group. Critical failures are alerted on
+        after they are persisted.
+
+        An empty group is a no-op and does not start a run.
+
+        Args:
+            failures: (error_message, level) pairs.
+        """
+        failures = list(failures)
+        if not failures:
+            return
+
+        with self._lock:
+            if self._current_run_id is None:
+                self.start_run()
+
+            run_id = self._current_run_id
+            occurred_at = _utc_timestamp()
+            critical = []
+            for error_message, level in failures:
+                self._failure_buffer.append((run_id, error_message, level, occurred_at))
+                if level == "critical":
+                    critical.append(error_message)
+
+            if critical or len(self._failure_buffer) >= self.failure_batch_size:
+                self.flush_failures()
+
+        for error_message in critical:
+            self._send_critical_alert(error_message)
+
+    def flush_failures(self) -> None:
+        """Write all buffered failures in a single batched insert.
+
+        Called automatically as described in the class docstring; call it
+        directly to persist buffered failures at a point of your choosing.
+        """
+        with self._lock:
+            if not self._failure_buffer:
+                return
+
+            self._db.executemany(_SQL_INSERT_FAILURE, self._failure_buffer)
+            self._failure_buffer.clear()
+
     def _send_critical_alert(self, error_message: str) -> None:
         """Send a critical alert notification.
 
         Args:
             error_message: The error message to include in the alert.
         """
+        alert = _alert_module()
+        if alert is None:
+            return
+
         try:
-            from trader.alert import send_alert
-            send_alert(f"Critical scraper failure: {error_message}", "critical")
+            alert.send_alert(f"Critical scraper failure: {error_message}", "critical")
         except Exception:
             pass  # Don't let alert failures break the scraper
 
@@ -112,20 +321,23 @@ class Scraper:
         Returns:
             'running', 'idle', 'error', or 'completed'.
         """
-        db = self._get_db()
-
-        # Check if there's a currently running scraper
-        result = db.execute(
-            """SELECT status FROM scraper_runs
-               ORDER BY started_at DESC
-               LIMIT 1"""
-        )
-        db.close()
+        # A run started by this instance is running until end_run
+        if self._current_run_id is not None:
+            return "running"
 
-        if not result:
-            return "idle"
+        now = time.monotonic()
+        cache = self._status_cache
+        if cache is not None:
+            cached_at, status = cache
+            if now - cached_at < self.status_ttl:
+                return status
 
-        return result[0]["status"]
+        # Check if there's a currently running scraper
+        with self._lock:
+            result = self._db.execute(_SQL_SELECT_LAST_STATUS)
+            status = result[0]["status"] if result else "idle"
+            self._status_cache = (now, status)
+        return status
 
     def get_current_run_id(self) -> Optional[int]:
         """Get the ID of the current scraper run.
@@ -144,15 +356,8 @@ class Scraper:
         Returns:
             List of run records.
         """
-        db = self._get_db()
-        result = db.execute(
-            """SELECT * FROM scraper_runs
-               ORDER BY started_at DESC
-               LIMIT ?""",
-            (limit,),
-        )
-        db.close()
-        return result
+        with self._lock:
+            return self._db.execute(_SQL_SELECT_RUN_HISTORY, (limit,))
 
     def get_recent_failures(self, limit: int = 10) -> list:
         """Get recent failures.
@@ -163,12 +368,6 @@ class Scraper:
         Returns:
             List of failure records.
         """
-        db = self._get_db()
-        result = db.execute(
-            """SELECT * FROM scraper_failures
-               ORDER BY occurred_at DESC
-               LIMIT ?""",
-            (limit,),
-        )
-        db.close()
-        return result
+        with self._lock:
+            self.flush_failures()
+            return self._db.execute(_SQL_SELECT_RECENT_FAILURES, (limit,))
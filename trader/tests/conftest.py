@@ -3,7 +3,7 @@ from typing import Dict, Any, Generator
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_html_basic() -> str:
     """Return a basic HTML fixture with item structure."""
     return """
@@ -19,7 +19,7 @@ def sample_html_basic() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_html_no_price() -> str:
     """Return HTML fixture without price element."""
     return """
@@ -34,7 +34,7 @@ def sample_html_no_price() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_html_no_title() -> str:
     """Return HTML fixture without title element."""
     return """
@@ -49,19 +49,19 @@ def sample_html_no_title() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_html_empty() -> str:
     """Return empty HTML fixture."""
     return ""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_html_invalid() -> str:
     """Return invalid/malformed HTML fixture."""
     return "<not-valid>unclosed tag"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_html_multiple_items() -> str:
     """Return HTML fixture with multiple items."""
     return """
@@ -143,7 +143,7 @@ def price_strings_invalid() -> list[str]:
 
 # Fixtures for parser.py module
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def parser_html_basic() -> str:
     """Return HTML fixture with .item-name, .price, and data-hash for parser.py."""
     return """
@@ -158,7 +158,7 @@ def parser_html_basic() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def parser_html_no_item_name() -> str:
     """Return HTML fixture without .item-name element."""
     return """
@@ -172,7 +172,7 @@ def parser_html_no_item_name() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def parser_html_no_price() -> str:
     """Return HTML fixture without .price element."""
     return """
@@ -186,7 +186,7 @@ def parser_html_no_price() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def parser_html_no_data_hash() -> str:
     """Return HTML fixture without data-hash attribute."""
     return """
@@ -201,7 +201,7 @@ def parser_html_no_data_hash() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def parser_html_empty_hash() -> str:
     """Return HTML fixture with empty data-hash attribute."""
     return """
@@ -216,13 +216,13 @@ def parser_html_empty_hash() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def parser_html_empty() -> str:
     """Return empty HTML fixture for parser.py."""
     return ""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def parser_html_whitespace() -> str:
     """Return whitespace-only HTML fixture for parser.py."""
     return "   \n\t   "
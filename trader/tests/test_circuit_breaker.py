@@ -7,15 +7,54 @@ This module covers the circuit breaker pattern implementation including:
 - Integration with scraper operations
 """
 
+import importlib
 import threading
 import time
 import urllib.error
-from unittest.mock import Mock, patch
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Iterator
+from unittest.mock import patch
 
 import pytest
 
 from trader.exceptions import CircuitOpenError
-from trader.scraper import CircuitBreaker
+from trader.scraper import CircuitBreaker, Scraper
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Replace the scraper module's clock with one the test advances by hand."""
+    clock = SimpleNamespace(now=0.0)
+    fake_time = SimpleNamespace(
+        time=lambda: clock.now,
+        monotonic=lambda: clock.now,
+        sleep=time.sleep,
+    )
+    monkeypatch.setattr("trader.scraper.time", fake_time)
+    return clock
+
+
+@pytest.fixture(scope="module")
+def pool() -> Iterator[ThreadPoolExecutor]:
+    """Share one set of worker threads across the thread-safety tests."""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        yield executor
+
+
+@pytest.fixture
+def cb() -> CircuitBreaker:
+    """Return a fresh CircuitBreaker with the default threshold of 10."""
+    return CircuitBreaker(failure_threshold=10)
+
+
+@pytest.fixture
+def opened_cb() -> CircuitBreaker:
+    """Return a CircuitBreaker already tripped OPEN by ten failures."""
+    cb = CircuitBreaker(failure_threshold=10, recovery_timeout=60.0)
+    for _ in range(10):
+        cb.record_failure()
+    return cb
 
 
 class TestCircuitBreakerInitialization:
@@ -39,23 +78,14 @@ class TestCircuitBreakerInitialization:
         assert cb.recovery_timeout == 30.0
         assert cb.current_state == "CLOSED"
     
-    def test_initial_failure_count_is_zero(self) -> None:
-        """Test failure count starts at zero."""
-        cb = CircuitBreaker()
-        
-        assert cb.failure_count == 0
-    
-    def test_initial_state_is_closed(self) -> None:
-        """Test circuit starts in CLOSED state."""
-        cb = CircuitBreaker()
-        
-        assert cb.current_state == "CLOSED"
-    
-    def test_initial_last_failure_time_is_none(self) -> None:
-        """Test last failure time starts as None."""
-        cb = CircuitBreaker()
-        
-        assert cb.last_failure_time is None
+    @pytest.mark.parametrize("attribute,expected", [
+        ("current_state", "CLOSED"),
+        ("failure_count", 0),
+        ("last_failure_time", None),
+    ])
+    def test_initial_values(self, cb: CircuitBreaker, attribute: str, expected: object) -> None:
+        """Test a new circuit starts CLOSED with no recorded failures."""
+        assert getattr(cb, attribute) == expected
 
 
 class TestCircuitBreakerClosedState:
@@ -103,42 +133,26 @@ class TestCircuitBreakerClosedState:
 class TestCircuitBreakerOpensAfterThreshold:
     """Tests for circuit opening after threshold failures."""
     
-    def test_circuit_opens_after_exactly_10_failures(self) -> None:
-        """Test circuit transitions to OPEN after exactly 10 consecutive failures."""
-        cb = CircuitBreaker(failure_threshold=10)
-        
-        # Record exactly 9 failures - should still be CLOSED
-        for _ in range(9):
+    @pytest.mark.parametrize("failures,expected_state,expected_count", [
+        (0, "CLOSED", 0),
+        (1, "CLOSED", 1),
+        (5, "CLOSED", 5),
+        (9, "CLOSED", 9),
+        (10, "OPEN", 10),
+    ])
+    def test_state_after_failures(
+        self,
+        cb: CircuitBreaker,
+        failures: int,
+        expected_state: str,
+        expected_count: int
+    ) -> None:
+        """Test circuit stays CLOSED below 10 failures and OPENs at exactly 10."""
+        for _ in range(failures):
             cb.record_failure()
         
-        assert cb.current_state == "CLOSED"
-        assert cb.failure_count == 9
-        
-        # 10th failure should open the circuit
-        cb.record_failure()
-        
-        assert cb.current_state == "OPEN"
-        assert cb.failure_count == 10
-        assert cb.last_failure_time is not None
-    
-    def test_circuit_opens_after_threshold_crossed(self) -> None:
-        """Test circuit opens when failure threshold is crossed."""
-        cb = CircuitBreaker(failure_threshold=10)
-        
-        # Simulate 10 failures
-        for _ in range(10):
-            cb.record_failure()
-        
-        assert cb.current_state == "OPEN"
-    
-    def test_failure_count_continues_after_open(self) -> None:
-        """Test failure count is 10 when circuit opens."""
-        cb = CircuitBreaker(failure_threshold=10)
-        
-        for _ in range(10):
-            cb.record_failure()
-        
-        assert cb.failure_count == 10
+        assert cb.current_state == expected_state
+        assert cb.failure_count == expected_count
     
     def test_last_failure_time_set_on_open(self) -> None:
         """Test last_failure_time is set when circuit opens."""
@@ -158,58 +172,48 @@ class TestCircuitBreakerOpensAfterThreshold:
 class TestCircuitBreakerOpenState:
     """Tests for OPEN state behavior."""
     
-    def test_circuit_rejects_calls_when_open(self) -> None:
+    def test_circuit_rejects_calls_when_open(self, opened_cb: CircuitBreaker) -> None:
         """Test CircuitOpenError is raised when circuit is OPEN."""
-        cb = CircuitBreaker(failure_threshold=10)
-        
-        # Open the circuit
-        for _ in range(10):
-            cb.record_failure()
-        
-        assert cb.current_state == "OPEN"
+        assert opened_cb.current_state == "OPEN"
         
         # Call should be rejected
         with pytest.raises(CircuitOpenError) as exc_info:
-            cb.call(lambda: "success")
+            opened_cb.call(lambda: "success")
         
         assert "Circuit breaker is OPEN" in str(exc_info.value)
         assert "10" in str(exc_info.value)
     
-    def test_call_not_executed_when_open(self) -> None:
+    def test_call_not_executed_when_open(self, opened_cb: CircuitBreaker) -> None:
         """Test function is NOT called when circuit is open."""
-        cb = CircuitBreaker(failure_threshold=10)
-        mock_func = Mock(return_value="result")
+        called = False
         
-        # Open the circuit
-        for _ in range(10):
-            cb.record_failure()
+        def func() -> str:
+            nonlocal called
+            called = True
+            return "result"
         
         try:
-            cb.call(mock_func)
+            opened_cb.call(func)
         except CircuitOpenError:
             pass
         
-        mock_func.assert_not_called()
+        assert not called
     
-    def test_open_state_persists_until_timeout(self) -> None:
+    def test_open_state_persists_until_timeout(self, opened_cb: CircuitBreaker) -> None:
         """Test circuit stays OPEN until recovery timeout elapses."""
-        cb = CircuitBreaker(failure_threshold=10, recovery_timeout=60.0)
-        
-        # Open the circuit
-        for _ in range(10):
-            cb.record_failure()
-        
         # Immediately try to call - should still be open
         with pytest.raises(CircuitOpenError):
-            cb.call(lambda: "success")
+            opened_cb.call(lambda: "success")
         
-        assert cb.current_state == "OPEN"
+        assert opened_cb.current_state == "OPEN"
 
 
 class TestCircuitBreakerHalfOpenState:
     """Tests for HALF_OPEN state behavior."""
     
-    def test_circuit_transitions_to_half_open_after_timeout(self) -> None:
+    def test_circuit_transitions_to_half_open_after_timeout(
+        self, frozen_clock: SimpleNamespace
+    ) -> None:
         """Test circuit transitions to HALF_OPEN after recovery timeout."""
         cb = CircuitBreaker(failure_threshold=10, recovery_timeout=0.1)
         
@@ -219,8 +223,8 @@ class TestCircuitBreakerHalfOpenState:
         
         assert cb.current_state == "OPEN"
         
-        # Wait for timeout
-        time.sleep(0.15)
+        # Advance past the timeout
+        frozen_clock.now += 0.2
         
         # This call should transition to HALF_OPEN and execute
         result = cb.call(lambda: "success")
@@ -230,14 +234,13 @@ class TestCircuitBreakerHalfOpenState:
     
     def test_success_in_half_opens_closes_circuit(self) -> None:
         """Test successful call in HALF_OPEN closes circuit and resets failures."""
-        cb = CircuitBreaker(failure_threshold=10, recovery_timeout=0.1)
+        # The timeout length is incidental here, so recover immediately
+        cb = CircuitBreaker(failure_threshold=10, recovery_timeout=0)
         
         # Open the circuit
         for _ in range(10):
             cb.record_failure()
         
-        time.sleep(0.15)
-        
         # Call will transition to HALF_OPEN, then success closes circuit
         cb.call(lambda: "success")
         
@@ -247,14 +250,13 @@ class TestCircuitBreakerHalfOpenState:
     
     def test_failure_in_half_open_reopens_immediately(self) -> None:
         """Test failure in HALF_OPEN immediately reopens the circuit."""
-        cb = CircuitBreaker(failure_threshold=10, recovery_timeout=0.1)
+        # The timeout length is incidental here, so recover immediately
+        cb = CircuitBreaker(failure_threshold=10, recovery_timeout=0)
         
         # Open the circuit
         for _ in range(10):
             cb.record_failure()
         
-        time.sleep(0.15)
-        
         # Transition to HALF_OPEN by calling
         # This should fail and transition to OPEN
         def failing_func():
@@ -268,7 +270,9 @@ class TestCircuitBreakerHalfOpenState:
         # Failure count should have incremented
         assert cb.failure_count == 11
     
-    def test_half_open_state_transition_on_timeout(self) -> None:
+    def test_half_open_state_transition_on_timeout(
+        self, frozen_clock: SimpleNamespace
+    ) -> None:
         """Test recovery timeout triggers transition to HALF_OPEN."""
         cb = CircuitBreaker(failure_threshold=10, recovery_timeout=0.1)
         
@@ -280,8 +284,8 @@ class TestCircuitBreakerHalfOpenState:
         with pytest.raises(CircuitOpenError):
             cb.call(lambda: "should fail")
         
-        # Wait for timeout
-        time.sleep(0.15)
+        # Advance past the timeout
+        frozen_clock.now += 0.2
         
         # Now call should be allowed and transition to HALF_OPEN/CLOSED
         result = cb.call(lambda: "should succeed")
@@ -293,22 +297,20 @@ class TestCircuitBreakerHalfOpenState:
 class TestCircuitBreakerReset:
     """Tests for manual reset functionality."""
     
-    def test_reset_closes_circuit(self) -> None:
-        """Test reset() forces circuit to CLOSED state."""
-        cb = CircuitBreaker(failure_threshold=10)
+    def test_reset_restores_initial_state(self, opened_cb: CircuitBreaker) -> None:
+        """Test reset() closes an open circuit and clears its failure record."""
+        assert opened_cb.current_state == "OPEN"
+        assert opened_cb.last_failure_time is not None
         
-        # Open the circuit
-        for _ in range(10):
-            cb.record_failure()
-        
-        assert cb.current_state == "OPEN"
-        
-        cb.reset()
+        opened_cb.reset()
         
-        assert cb.current_state == "CLOSED"
+        assert opened_cb.current_state == "CLOSED"
+        assert opened_cb.failure_count == 0
+        assert opened_cb.last_failure_time is None
+        assert opened_cb.call(lambda: "success") == "success"
     
     def test_reset_clears_failure_count(self) -> None:
-        """Test reset() clears the failure count."""
+        """Test reset() clears the failure count while still CLOSED."""
         cb = CircuitBreaker(failure_threshold=10)
         
         for _ in range(5):
@@ -319,111 +321,67 @@ class TestCircuitBreakerReset:
         cb.reset()
         
         assert cb.failure_count == 0
-    
-    def test_reset_clears_last_failure_time(self) -> None:
-        """Test reset() clears the last failure time."""
-        cb = CircuitBreaker(failure_threshold=10)
-        
-        for _ in range(10):
-            cb.record_failure()
-        
-        assert cb.last_failure_time is not None
-        
-        cb.reset()
-        
-        assert cb.last_failure_time is None
-    
-    def test_call_allowed_after_reset(self) -> None:
-        """Test calls are allowed after manual reset."""
-        cb = CircuitBreaker(failure_threshold=10)
-        
-        # Open the circuit
-        for _ in range(10):
-            cb.record_failure()
-        
-        # Reset
-        cb.reset()
-        
-        # Call should succeed
-        result = cb.call(lambda: "success")
-        
-        assert result == "success"
 
 
 class TestCircuitBreakerThreadSafety:
-    """Tests for thread safety."""
+    """Tests for thread safety.
     
-    def test_concurrent_failure_records(self) -> None:
+    A few pooled threads released together by a barrier contend harder than
+    many threads started one after another, without per-test thread spawns.
+    """
+    
+    def test_concurrent_failure_records(self, pool: ThreadPoolExecutor) -> None:
         """Test concurrent failure recording is thread-safe."""
         cb = CircuitBreaker(failure_threshold=1000)
+        barrier = threading.Barrier(4)
         
         def record_many_failures():
-            for _ in range(10):
+            barrier.wait()
+            for _ in range(25):
                 cb.record_failure()
         
-        threads = [
-            threading.Thread(target=record_many_failures)
-            for _ in range(10)
-        ]
-        
-        for t in threads:
-            t.start()
+        list(pool.map(lambda _: record_many_failures(), range(4)))
         
-        for t in threads:
-            t.join()
-        
-        assert cb.failure_count == 100  # 10 threads * 10 failures each
+        assert cb.failure_count == 100  # 4 threads * 25 failures each
     
-    def test_concurrent_success_resets(self) -> None:
+    def test_concurrent_success_resets(self, pool: ThreadPoolExecutor) -> None:
         """Test concurrent success recording is thread-safe."""
         cb = CircuitBreaker(failure_threshold=1000)
+        barrier = threading.Barrier(4)
         
         # Add some failures
         for _ in range(50):
             cb.record_failure()
         
         def record_success():
+            barrier.wait()
             cb.record_success()
         
-        threads = [
-            threading.Thread(target=record_success)
-            for _ in range(10)
-        ]
-        
-        for t in threads:
-            t.start()
-        
-        for t in threads:
-            t.join()
+        list(pool.map(lambda _: record_success(), range(4)))
         
         # After successes, count should be 0
         assert cb.failure_count == 0
     
-    def test_concurrent_call_synchronization(self) -> None:
+    def test_concurrent_call_synchronization(self, pool: ThreadPoolExecutor) -> None:
         """Test concurrent calls are properly synchronized."""
         cb = CircuitBreaker(failure_threshold=10, recovery_timeout=0.1)
+        barrier = threading.Barrier(4)
         
         results = []
         
         def call_and_record():
-            try:
-                result = cb.call(lambda: "success")
-                results.append(("success", result))
-            except Exception as e:
-                results.append(("error", str(e)))
-        
-        threads = [
-            threading.Thread(target=call_and_record)
-            for _ in range(20)
-        ]
-        
-        for t in threads:
-            t.start()
+            barrier.wait()
+            for _ in range(5):
+                try:
+                    result = cb.call(lambda: "success")
+                    results.append(("success", result))
+                except Exception as e:
+                    results.append(("error", str(e)))
         
-        for t in threads:
-            t.join()
+        list(pool.map(lambda _: call_and_record(), range(4)))
         
         # All calls should have either succeeded or raised CircuitOpenError
+        assert len(results) == 20
         for status, _ in results:
             assert status in ("success", "error")
 
@@ -487,12 +445,14 @@ class TestCircuitBreakerCall:
 class TestCircuitBreakerWithScraper:
     """Integration tests with the Scraper class."""
     
-    def test_circuit_breaker_protects_scraper_call(self) -> None:
+    @pytest.fixture(scope="class")
+    def scraper(self):
+        """Build one Scraper for the class; fetch_url is patched per test."""
+        return Scraper(timeout=5)
+    
+    def test_circuit_breaker_protects_scraper_call(self, scraper) -> None:
         """Test circuit breaker can wrap scraper operations."""
-        from trader.scraper import Scraper
-        
         cb = CircuitBreaker(failure_threshold=10)
-        scraper = Scraper(timeout=5)
         
         # Circuit should be CLOSED, call should work
         # Note: This is a mock test to avoid network calls
@@ -501,17 +461,16 @@ class TestCircuitBreakerWithScraper:
         
         assert result == "mock content"
     
-    def test_circuit_opens_after_many_scraper_failures(self) -> None:
+    def test_circuit_opens_after_many_scraper_failures(self, scraper) -> None:
         """Test circuit opens after repeated scraper failures."""
-        from trader.scraper import Scraper
-        
         cb = CircuitBreaker(failure_threshold=10)
-        scraper = Scraper(timeout=5)
+        # Built once; the mock re-raises the same instance on every call
+        error = urllib.error.HTTPError(
+            url="http://example.com", code=500, msg="Server Error", hdrs={}, fp=None
+        )
         
         # Mock fetch_url to always fail with an exception
-        with patch.object(scraper, 'fetch_url', side_effect=urllib.error.HTTPError(
-            url="http://example.com", code=500, msg="Server Error", hdrs={}, fp=None
-        )):
+        with patch.object(scraper, 'fetch_url', side_effect=error):
             # Simulate 9 failures (HTTPError is a network exception)
             for _ in range(9):
                 try:
@@ -537,45 +496,25 @@ class TestCircuitBreakerIntegration:
     
     def test_imports(self) -> None:
         """Test CircuitBreaker is importable from scraper module."""
-        from trader.scraper import CircuitBreaker as CB
+        module = importlib.import_module("trader.scraper")
+        assert hasattr(module, "CircuitBreaker")
         
-        cb = CB()
+        cb = module.CircuitBreaker()
         assert cb is not None
         assert cb.current_state == "CLOSED"
     
     def test_exception_import(self) -> None:
         """Test CircuitOpenError is importable."""
-        from trader.exceptions import CircuitOpenError as COE
+        module = importlib.import_module("trader.exceptions")
+        assert hasattr(module, "CircuitOpenError")
         
-        ex = COE("test")
+        ex = module.CircuitOpenError("test")
         assert str(ex) == "test"
 
 
 class TestCircuitBreakerProperties:
     """Tests for circuit breaker properties."""
     
-    def test_current_state_property_returns_state(self) -> None:
-        """Test current_state property returns correct value."""
-        cb = CircuitBreaker()
-        
-        assert cb.current_state == "CLOSED"
-        
-        for _ in range(10):
-            cb.record_failure()
-        
-        assert cb.current_state == "OPEN"
-    
-    def test_failure_count_property_returns_count(self) -> None:
-        """Test failure_count property returns correct value."""
-        cb = CircuitBreaker()
-        
-        assert cb.failure_count == 0
-        
-        cb.record_failure()
-        cb.record_failure()
-        
-        assert cb.failure_count == 2
-    
     def test_last_failure_time_property_returns_time(self) -> None:
         """Test last_failure_time property returns correct value."""
         cb = CircuitBreaker()
@@ -610,10 +549,11 @@ class TestEdgeCases:
         assert cb.current_state == "OPEN"
     
     def test_very_large_failure_threshold(self) -> None:
-        """Test large threshold never opens."""
-        cb = CircuitBreaker(failure_threshold=10000)
+        """Test a threshold above the failure count never opens."""
+        cb = CircuitBreaker(failure_threshold=101)
         
-        for _ in range(9999):
+        # One short of the threshold covers the same boundary as any larger value
+        for _ in range(100):
             cb.record_failure()
         
         assert cb.current_state == "CLOSED"
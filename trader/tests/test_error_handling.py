@@ -1,148 +1,369 @@
 """Tests for error handling utilities - retry decorator and circuit breaker."""
+import asyncio
+import inspect
 import time
 import threading
 import pytest
-from typing import Type
-from unittest.mock import MagicMock, patch
+from typing import Dict, List, Optional, Tuple, Type
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from trader.error_handling import (
-    retry, CircuitBreaker, CircuitState, 
-    circuit_breaker, RetryWithCircuitBreaker
+    aretry, retry, CircuitBreaker, CircuitSnapshot, CircuitState, 
+    circuit_breaker, RetryWithCircuitBreaker, is_unrecoverable_http_error
 )
 from trader.exceptions import MaxRetriesExceededError, CircuitBreakerOpenError
 
 
+@pytest.fixture(autouse=True)
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> List[float]:
+    """Make blocking retry sleeps no-ops and record the requested delays."""
+    delays: List[float] = []
+    monkeypatch.setattr("trader.error_handling.time.sleep", delays.append)
+    return delays
+
+
 class TestRetryDecorator:
     """Test cases for the retry decorator."""
     
-    def test_retry_success_on_first_attempt(self) -> None:
-        """Test function succeeds on first attempt - no retries needed."""
-        mock_func = MagicMock(return_value="success")
+    @pytest.mark.parametrize(
+        ("max_attempts", "exceptions", "raise_seq", "expected_calls",
+         "expected_result", "expected_exc"),
+        [
+            pytest.param(3, (Exception,), (None,), 1, "success", None,
+                         id="success_on_first_attempt"),
+            pytest.param(3, (ValueError,), (ValueError, ValueError, None), 3, "success", None,
+                         id="success_after_failures"),
+            pytest.param(3, (ValueError,), (ValueError,) * 3, 3, None, MaxRetriesExceededError,
+                         id="raises_max_retries_exceeded"),
+            pytest.param(3, (RuntimeError,), (ValueError,), 1, None, ValueError,
+                         id="only_catches_specified_exceptions"),
+            pytest.param(3, (ValueError, RuntimeError), (ValueError, RuntimeError, None), 3,
+                         "success", None, id="catches_multiple_exception_types"),
+            pytest.param(5, (Exception,), (Exception,) * 5, 5, None, MaxRetriesExceededError,
+                         id="custom_max_attempts"),
+            pytest.param(2, (ValueError,), (ValueError,) * 2, 2, None, MaxRetriesExceededError,
+                         id="single_exception_tuple"),
+        ],
+    )
+    def test_retry_behavior(
+        self,
+        max_attempts: int,
+        exceptions: Tuple[Type[Exception], ...],
+        raise_seq: Tuple[Optional[Type[Exception]], ...],
+        expected_calls: int,
+        expected_result: Optional[str],
+        expected_exc: Optional[Type[Exception]],
+    ) -> None:
+        """Test the outcome and call count for a sequence of per-call raises."""
+        call_count = 0
         
-        @retry(max_attempts=3, exceptions=(Exception,))
-        def target_func():
-            return mock_func()
+        @retry(max_attempts=max_attempts, exceptions=exceptions)
+        def target_func() -> str:
+            nonlocal call_count
+            error = raise_seq[call_count]
+            call_count += 1
+            if error is not None:
+                raise error(f"error {call_count}")
+            return "success"
         
-        result = target_func()
+        if expected_exc is None:
+            assert target_func() == expected_result
+        else:
+            with pytest.raises(expected_exc) as exc_info:
+                target_func()
+            if expected_exc is MaxRetriesExceededError:
+                assert f"failed after {expected_calls} attempts" in str(exc_info.value)
         
-        assert result == "success"
-        assert mock_func.call_count == 1
+        assert call_count == expected_calls
     
-    def test_retry_success_after_failures(self) -> None:
-        """Test function succeeds after a few failures."""
+    def test_retry_preserves_exception_chain(self) -> None:
+        """Test that original exception is preserved in the chain."""
+        original_error = ValueError("original error")
+        
+        @retry(max_attempts=2, exceptions=(ValueError,))
+        def always_fails() -> None:
+            raise original_error
+        
+        with pytest.raises(MaxRetriesExceededError) as exc_info:
+            always_fails()
+        
+        assert exc_info.value.__cause__ is original_error
+    
+    def test_retry_exponential_backoff(self, sleeps: List[float]) -> None:
+        """Test that retry uses exponential backoff between attempts."""
         call_count = 0
         
-        @retry(max_attempts=3, exceptions=(ValueError,))
-        def target_func():
+        @retry(max_attempts=4, exceptions=(RuntimeError,), delay=1.0, backoff=2.0)
+        def always_fails() -> None:
             nonlocal call_count
             call_count += 1
-            if call_count < 3:
-                raise ValueError(f"error {call_count}")
+            raise RuntimeError("error")
+        
+        with pytest.raises(MaxRetriesExceededError):
+            always_fails()
+        
+        # 3 delays for 4 attempts, none after the final failure
+        assert sleeps == [1.0, 2.0, 4.0]
+    
+    def test_retry_no_delay_on_success(self, sleeps: List[float]) -> None:
+        """Test that no sleep occurs when function succeeds immediately."""
+        @retry(max_attempts=3, exceptions=(Exception,), delay=1.0)
+        def success_func() -> str:
             return "success"
         
-        result = target_func()
+        result = success_func()
         
         assert result == "success"
-        assert call_count == 3
+        assert sleeps == []
     
-    def test_retry_raises_max_retries_exceeded(self) -> None:
-        """Test that MaxRetriesExceededError is raised after all retries fail."""
-        @retry(max_attempts=3, exceptions=(ValueError,))
-        def always_fails():
-            raise ValueError("always fails")
+    def test_retry_honours_retry_after(self, sleeps: List[float]) -> None:
+        """Test that an exception's retry_after replaces the backoff delay."""
+        class RateLimitedError(Exception):
+            def __init__(self, retry_after: float) -> None:
+                super().__init__("rate limited")
+                self.retry_after = retry_after
+        
+        errors = [RateLimitedError(7.0), RuntimeError("error")]
+        
+        @retry(max_attempts=3, exceptions=(Exception,), delay=1.0, backoff=2.0)
+        def flaky() -> str:
+            if errors:
+                raise errors.pop(0)
+            return "success"
         
-        with pytest.raises(MaxRetriesExceededError) as exc_info:
+        assert flaky() == "success"
+        
+        assert sleeps == [7.0, 2.0]
+    
+    def test_retry_after_clamped_and_non_finite_ignored(self, sleeps: List[float]) -> None:
+        """Test that negative retry_after sleeps 0 and NaN/inf fall back to backoff."""
+        errors = []
+        for retry_after in (-30.0, float("nan"), float("inf")):
+            error = RuntimeError("rate limited")
+            error.retry_after = retry_after  # type: ignore[attr-defined]
+            errors.append(error)
+        
+        @retry(max_attempts=4, exceptions=(RuntimeError,), delay=1.0, backoff=2.0)
+        def flaky() -> str:
+            if errors:
+                raise errors.pop(0)
+            return "success"
+        
+        assert flaky() == "success"
+        assert sleeps == [0.0, 2.0, 4.0]
+    
+    def test_retry_max_delay_caps_sleeps(self, sleeps: List[float]) -> None:
+        """Test that max_delay caps both backoff and retry_after waits."""
+        rate_limited = RuntimeError("rate limited")
+        rate_limited.retry_after = 600  # type: ignore[attr-defined]
+        errors = [rate_limited, RuntimeError("error"), RuntimeError("error"),
+                  RuntimeError("error")]
+        
+        @retry(max_attempts=4, exceptions=(RuntimeError,), delay=2.0,
+               backoff=2.0, max_delay=5.0)
+        def always_fails() -> None:
+            raise errors.pop(0)
+        
+        with pytest.raises(MaxRetriesExceededError):
             always_fails()
         
-        assert "failed after 3 attempts" in str(exc_info.value)
+        # retry_after 600 -> 5.0, backoff 4.0 stays, backoff 8.0 -> 5.0
+        assert sleeps == [5.0, 4.0, 5.0]
     
-    def test_retry_preserves_exception_chain(self) -> None:
-        """Test that original exception is preserved in the chain."""
-        original_error = ValueError("original error")
+    def test_retry_large_max_attempts_with_max_delay(self, sleeps: List[float]) -> None:
+        """Test that a long capped schedule neither overflows nor exceeds the cap."""
+        @retry(max_attempts=1100, exceptions=(RuntimeError,), delay=0.1, max_delay=5.0)
+        def always_fails() -> None:
+            raise RuntimeError("error")
         
-        @retry(max_attempts=2, exceptions=(ValueError,))
-        def always_fails():
-            raise original_error
+        with pytest.raises(MaxRetriesExceededError, match="failed after 1100 attempts"):
+            always_fails()
         
-        with pytest.raises(MaxRetriesExceededError) as exc_info:
+        assert len(sleeps) == 1099
+        assert sleeps[:7] == pytest.approx([0.1, 0.2, 0.4, 0.8, 1.6, 3.2, 5.0])
+        assert set(sleeps[6:]) == {5.0}
+    
+    def test_retry_jitter_stays_within_bounds(self, sleeps: List[float]) -> None:
+        """Test that jittered delays fall between (1 - jitter) and 1x backoff."""
+        @retry(max_attempts=4, exceptions=(RuntimeError,), delay=1.0,
+               backoff=2.0, jitter=0.5)
+        def always_fails() -> None:
+            raise RuntimeError("error")
+        
+        with pytest.raises(MaxRetriesExceededError):
             always_fails()
         
-        assert exc_info.value.__cause__ is original_error
+        assert len(sleeps) == 3
+        for actual, nominal in zip(sleeps, [1.0, 2.0, 4.0]):
+            assert nominal * 0.5 <= actual <= nominal
     
-    def test_retry_only_catches_specified_exceptions(self) -> None:
-        """Test that only specified exceptions trigger retry."""
+    @pytest.mark.parametrize("jitter", [-0.1, 1.5, float("nan")])
+    def test_retry_rejects_jitter_outside_unit_range(self, jitter: float) -> None:
+        """Test that jitter outside 0.0-1.0 is rejected at decoration time."""
+        with pytest.raises(ValueError, match="jitter"):
+            retry(max_attempts=3, jitter=jitter)
+    
+    def test_retry_stops_at_max_elapsed(self, sleeps: List[float]) -> None:
+        """Test that no retry starts if its sleep would overrun max_elapsed."""
         call_count = 0
         
-        @retry(max_attempts=3, exceptions=(RuntimeError,))
-        def target_func():
+        @retry(max_attempts=5, exceptions=(RuntimeError,), delay=1.0,
+               backoff=2.0, max_elapsed=2.5)
+        def always_fails() -> None:
             nonlocal call_count
             call_count += 1
-            raise ValueError("value error")  # Not in exceptions tuple
+            raise RuntimeError("error")
         
-        # ValueError should not be caught, so it propagates immediately
-        with pytest.raises(ValueError, match="value error"):
-            target_func()
+        with pytest.raises(MaxRetriesExceededError, match="failed after 3 attempts"):
+            always_fails()
+        
+        # Sleeps of 1.0 and 2.0 fit the budget; the next 4.0 would not
+        assert call_count == 3
+        assert sleeps == [1.0, 2.0]
+    
+    def test_retry_giveup_reraises_immediately(self, sleeps: List[float]) -> None:
+        """Test that an exception matching giveup is raised without retrying."""
+        call_count = 0
+        
+        @retry(max_attempts=5, exceptions=(ValueError,), giveup=lambda e: "fatal" in str(e))
+        def fails_fatally() -> None:
+            nonlocal call_count
+            call_count += 1
+            raise ValueError("fatal error")
+        
+        with pytest.raises(ValueError, match="fatal error") as exc_info:
+            fails_fatally()
         
-        # Should only be called once since ValueError is not caught
         assert call_count == 1
+        assert sleeps == []
+        # Re-raised bare from the wrapper, with no retry helper frames
+        frames = [entry.name for entry in exc_info.traceback]
+        assert "after_failure" not in frames
+        assert frames[-2:] == ["wrapper", "fails_fatally"]
+    
+    def test_is_unrecoverable_http_error(self) -> None:
+        """Test that only non-retryable 4xx statuses are unrecoverable."""
+        def http_error(code: int) -> Exception:
+            error = Exception("http")
+            error.code = code  # type: ignore[attr-defined]
+            return error
+        
+        assert is_unrecoverable_http_error(http_error(404)) is True
+        assert is_unrecoverable_http_error(http_error(401)) is True
+        assert is_unrecoverable_http_error(http_error(429)) is False
+        assert is_unrecoverable_http_error(http_error(408)) is False
+        assert is_unrecoverable_http_error(http_error(503)) is False
+        assert is_unrecoverable_http_error(ConnectionError("reset")) is False
+        
+        response_error = Exception("http")
+        response_error.response = MagicMock(status_code=410)  # type: ignore[attr-defined]
+        assert is_unrecoverable_http_error(response_error) is True
     
-    def test_retry_catches_multiple_exception_types(self) -> None:
-        """Test retry catches multiple specified exception types."""
+    def test_retry_async_function_retries_with_asyncio_sleep(self, sleeps: List[float]) -> None:
+        """Test that coroutine functions are retried without blocking sleeps."""
         call_count = 0
         
-        @retry(max_attempts=3, exceptions=(ValueError, RuntimeError))
-        def target_func():
+        @retry(max_attempts=3, exceptions=(ValueError,), delay=1.0, backoff=2.0)
+        async def flaky() -> str:
             nonlocal call_count
             call_count += 1
-            if call_count == 1:
-                raise ValueError("first")
-            if call_count == 2:
-                raise RuntimeError("second")
+            if call_count < 3:
+                raise ValueError("error")
             return "success"
         
-        result = target_func()
+        with patch("trader.error_handling.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            assert asyncio.run(flaky()) == "success"
         
-        assert result == "success"
         assert call_count == 3
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [1.0, 2.0]
+        assert sleeps == []
     
-    @patch("trader.error_handling.time.sleep")
-    def test_retry_exponential_backoff(self, mock_sleep: MagicMock) -> None:
-        """Test that retry uses exponential backoff between attempts."""
+    def test_retry_async_function_raises_after_max_attempts(self) -> None:
+        """Test that an always-failing coroutine raises MaxRetriesExceededError."""
+        @retry(max_attempts=2, exceptions=(ValueError,), delay=0.0)
+        async def always_fails() -> None:
+            raise ValueError("error")
+        
+        assert inspect.iscoroutinefunction(always_fails)
+        with pytest.raises(MaxRetriesExceededError, match="failed after 2 attempts"):
+            asyncio.run(always_fails())
+    
+    def test_aretry_backoff_awaits_asyncio_sleep(self) -> None:
+        """Test aretry awaits asyncio.sleep with the exponential schedule."""
         call_count = 0
         
-        @retry(max_attempts=4, exceptions=(RuntimeError,), delay=1.0, backoff=2.0)
-        def always_fails():
+        @aretry(max_attempts=4, exceptions=(ValueError,), delay=1.0, backoff=2.0)
+        async def always_fails() -> None:
             nonlocal call_count
             call_count += 1
-            raise RuntimeError("error")
-        
-        with pytest.raises(MaxRetriesExceededError):
-            always_fails()
+            raise ValueError("error")
         
-        # Check calls between retries (not after final failure)
-        assert mock_sleep.call_count == 3  # 3 delays for 4 attempts
+        with patch("trader.error_handling.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            with pytest.raises(MaxRetriesExceededError):
+                asyncio.run(always_fails())
         
-        # Verify exponential backoff: 1.0, 2.0, 4.0
-        expected_delays = [1.0, 2.0, 4.0]
-        actual_delays = [call[0][0] for call in mock_sleep.call_args_list]
-        assert actual_delays == expected_delays
+        assert call_count == 4
+        assert mock_sleep.await_count == 3
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [1.0, 2.0, 4.0]
     
-    @patch("trader.error_handling.time.sleep")
-    def test_retry_no_delay_on_success(self, mock_sleep: MagicMock) -> None:
-        """Test that no sleep occurs when function succeeds immediately."""
-        @retry(max_attempts=3, exceptions=(Exception,), delay=1.0)
-        def success_func():
-            return "success"
+    def test_aretry_rejects_plain_functions(self) -> None:
+        """Test aretry refuses to wrap a function that isn't a coroutine."""
+        with pytest.raises(TypeError, match="coroutine function"):
+            @aretry(max_attempts=2)
+            def not_async() -> str:
+                return "value"
+    
+    def test_aretry_concurrent_retries_do_not_block_loop(self) -> None:
+        """Test concurrent retrying coroutines wait in parallel, not in series."""
+        attempts: Dict[int, int] = {}
+        
+        @aretry(max_attempts=2, exceptions=(ValueError,), delay=0.05)
+        async def flaky(task_id: int) -> int:
+            attempts[task_id] = attempts.get(task_id, 0) + 1
+            if attempts[task_id] == 1:
+                raise ValueError("error")
+            return task_id
         
-        result = success_func()
+        async def run_all() -> List[int]:
+            return await asyncio.gather(*(flaky(i) for i in range(50)))
         
-        assert result == "success"
-        assert mock_sleep.call_count == 0
+        start = time.monotonic()
+        results = asyncio.run(run_all())
+        elapsed = time.monotonic() - start
+        
+        assert results == list(range(50))
+        # 50 serialized 0.05s sleeps would take 2.5s
+        assert elapsed < 1.0
+    
+    def test_retry_idempotency_key_skips_completed_calls(self) -> None:
+        """Test that a call whose key already succeeded is not repeated."""
+        calls: List[int] = []
+        completed: Dict[str, str] = {}
+        
+        @retry(max_attempts=3, exceptions=(ValueError,),
+               idempotency_key=lambda order_id: f"order-{order_id}", completed=completed)
+        def submit(order_id: int) -> str:
+            calls.append(order_id)
+            if len(calls) == 1:
+                raise ValueError("timeout")
+            return f"receipt-{order_id}"
+        
+        assert submit(7) == "receipt-7"
+        assert submit(7) == "receipt-7"
+        assert submit(8) == "receipt-8"
+        
+        assert calls == [7, 7, 8]
+        assert completed == {"order-7": "receipt-7", "order-8": "receipt-8"}
+    
+    def test_retry_idempotency_key_requires_completed(self) -> None:
+        """Test that idempotency_key without a results mapping is rejected."""
+        with pytest.raises(ValueError, match="completed"):
+            retry(idempotency_key=lambda order_id: order_id)
     
     def test_retry_preserves_function_metadata(self) -> None:
         """Test that retry decorator preserves function name and docstring."""
         @retry(max_attempts=3, exceptions=(Exception,))
-        def my_function():
+        def my_function() -> str:
             """My important function."""
             return "result"
         
@@ -159,36 +380,6 @@ class TestRetryDecorator:
         result = my_function(1, "test", c=3.14)
         
         assert result == (1, "test", 3.14)
-    
-    def test_retry_with_custom_max_attempts(self) -> None:
-        """Test retry with custom max_attempts value."""
-        attempt_count = 0
-        
-        @retry(max_attempts=5, exceptions=(Exception,))
-        def counting_fails():
-            nonlocal attempt_count
-            attempt_count += 1
-            raise Exception("error")
-        
-        with pytest.raises(MaxRetriesExceededError):
-            counting_fails()
-        
-        assert attempt_count == 5
-    
-    def test_retry_with_single_exception_tuple(self) -> None:
-        """Test retry with single-element exception tuple."""
-        call_count = 0
-        
-        @retry(max_attempts=2, exceptions=(ValueError,))
-        def always_fails():
-            nonlocal call_count
-            call_count += 1
-            raise ValueError("error")
-        
-        with pytest.raises(MaxRetriesExceededError):
-            always_fails()
-        
-        assert call_count == 2
 
 
 class TestCircuitBreaker:
@@ -205,7 +396,7 @@ class TestCircuitBreaker:
         """AC2: Test circuit breaker opens after threshold failures."""
         cb = CircuitBreaker(failure_threshold=3, expected_exception=ValueError)
         
-        def failure_func():
+        def failure_func() -> None:
             raise ValueError("error")
         
         # Trigger threshold failures
@@ -220,7 +411,7 @@ class TestCircuitBreaker:
         """AC3: Test circuit breaker rejects calls when open with CircuitBreakerOpenError."""
         cb = CircuitBreaker(failure_threshold=1, expected_exception=ValueError)
         
-        def failure_func():
+        def failure_func() -> None:
             raise ValueError("error")
         
         # Trigger circuit breaker to open
@@ -235,7 +426,7 @@ class TestCircuitBreaker:
     
     def test_circuit_breaker_half_open_after_cooldown(self) -> None:
         """AC4: Test circuit breaker transitions to HALF_OPEN after cooldown period."""
-        with patch("trader.error_handling.time.time") as mock_time:
+        with patch("trader.error_handling.time.monotonic") as mock_time:
             # Use a list to simulate mutable time
             current_time = [0.0]
             mock_time.side_effect = lambda: current_time[0]
@@ -246,7 +437,7 @@ class TestCircuitBreaker:
                 expected_exception=ValueError
             )
             
-            def failure_func():
+            def failure_func() -> None:
                 raise ValueError("error")
             
             # Trigger circuit breaker to open at time 0
@@ -278,7 +469,7 @@ class TestCircuitBreaker:
         cb._state = CircuitState.HALF_OPEN
         cb._failure_count = 1
         
-        def success_func():
+        def success_func() -> str:
             return "success"
         
         result = cb.call(success_func)
@@ -291,7 +482,7 @@ class TestCircuitBreaker:
         """AC6: Test that failure count resets on successful call."""
         cb = CircuitBreaker(failure_threshold=5, expected_exception=ValueError)
         
-        def failure_func():
+        def failure_func() -> None:
             raise ValueError("error")
         
         # Accumulate some failures (but not enough to open)
@@ -302,7 +493,7 @@ class TestCircuitBreaker:
         assert cb.failure_count == 3
         
         # Success should reset the counter
-        def success_func():
+        def success_func() -> str:
             return "success"
         
         result = cb.call(success_func)
@@ -356,7 +547,7 @@ class TestCircuitBreaker:
         call_count = 0
         
         @circuit_breaker(failure_threshold=2, recovery_timeout=30.0, expected_exception=ValueError)
-        def protected_function():
+        def protected_function() -> None:
             nonlocal call_count
             call_count += 1
             raise ValueError(f"error {call_count}")
@@ -381,7 +572,7 @@ class TestCircuitBreaker:
         """Test successful call returns result and resets state."""
         cb = CircuitBreaker(failure_threshold=3)
         
-        def success_func():
+        def success_func() -> str:
             return "success"
         
         result = cb.call(success_func)
@@ -394,7 +585,7 @@ class TestCircuitBreaker:
         """Test circuit breaker counts consecutive failures."""
         cb = CircuitBreaker(failure_threshold=3, expected_exception=ValueError)
         
-        def failure_func():
+        def failure_func() -> None:
             raise ValueError("error")
         
         for _ in range(2):
@@ -409,7 +600,7 @@ class TestCircuitBreaker:
         cb = CircuitBreaker(failure_threshold=2, expected_exception=ValueError)
         
         @cb
-        def protected_func():
+        def protected_func() -> None:
             raise ValueError("error")
         
         # First failure
@@ -427,7 +618,7 @@ class TestCircuitBreaker:
         cb = CircuitBreaker()
         
         @cb
-        def my_protected_function():
+        def my_protected_function() -> str:
             """My protected function docstring."""
             return "result"
         
@@ -435,6 +626,76 @@ class TestCircuitBreaker:
         assert my_protected_function.__doc__ == "My protected function docstring."
 
 
+    def test_circuit_breaker_closed_success_skips_lock(self) -> None:
+        """Test that a success on a clean CLOSED circuit takes no lock."""
+        cb = CircuitBreaker()
+        cb._lock = MagicMock()
+        
+        assert cb.call(lambda: "success") == "success"
+        
+        assert cb._lock.__enter__.call_count == 0
+        assert cb.state == CircuitState.CLOSED
+    
+    def test_circuit_breaker_property_reads_skip_lock(self) -> None:
+        """Test that reading state and counters takes no lock."""
+        cb = CircuitBreaker()
+        cb._lock = MagicMock()
+        
+        assert cb.state == CircuitState.CLOSED
+        assert cb.failure_count == 0
+        assert cb.last_failure_time is None
+        
+        assert cb._lock.__enter__.call_count == 0
+    
+    def test_circuit_breaker_snapshot(self) -> None:
+        """Test snapshot returns state and counters from one moment."""
+        cb = CircuitBreaker(failure_threshold=1, expected_exception=ValueError)
+        
+        assert cb.snapshot() == CircuitSnapshot(CircuitState.CLOSED, 0, None)
+        
+        def failure_func() -> None:
+            raise ValueError("error")
+        
+        with pytest.raises(ValueError):
+            cb.call(failure_func)
+        
+        snap = cb.snapshot()
+        assert snap.state == CircuitState.OPEN
+        assert snap.failure_count == 1
+        assert snap.last_failure_time == cb.last_failure_time
+    
+    def test_circuit_breaker_closed_success_resets_failures(self) -> None:
+        """Test that a success after failures still resets the count."""
+        cb = CircuitBreaker(failure_threshold=5, expected_exception=ValueError)
+        
+        def failure_func() -> None:
+            raise ValueError("error")
+        
+        with pytest.raises(ValueError):
+            cb.call(failure_func)
+        assert cb.failure_count == 1
+        
+        assert cb.call(lambda: "success") == "success"
+        assert cb.failure_count == 0
+    
+    def test_circuit_breaker_is_open(self) -> None:
+        """Test is_open reports OPEN only until the recovery timeout elapses."""
+        cb = CircuitBreaker(failure_threshold=1, recovery_timeout=60.0)
+        
+        assert cb.is_open() is False
+        
+        def failure_func() -> None:
+            raise ValueError("error")
+        
+        with pytest.raises(ValueError):
+            cb.call(failure_func)
+        
+        assert cb.is_open() is True
+        
+        cb._last_failure_time = time.monotonic() - 61.0
+        assert cb.is_open() is False
+
+
 class TestRetryWithCircuitBreaker:
     """Test cases for combined retry and circuit breaker."""
     
@@ -446,7 +707,7 @@ class TestRetryWithCircuitBreaker:
         )
         
         @combined
-        def protected_func():
+        def protected_func() -> str:
             return "success"
         
         result = protected_func()
@@ -458,24 +719,96 @@ class TestRetryWithCircuitBreaker:
         combined = RetryWithCircuitBreaker()
         
         @combined
-        def combined_func():
+        def combined_func() -> str:
             """Combined function docstring."""
             return "result"
         
         assert combined_func.__name__ == "combined_func"
         assert combined_func.__doc__ == "Combined function docstring."
+    
+    def test_combined_decorator_reraises_last_exception(self, sleeps: List[float]) -> None:
+        """Test that the final attempt's exception propagates unchanged."""
+        combined = RetryWithCircuitBreaker(max_attempts=3, failure_threshold=10)
+        errors = [ValueError("first"), ValueError("second"), ValueError("third")]
+        
+        @combined
+        def always_fails() -> None:
+            raise errors.pop(0)
+        
+        with pytest.raises(ValueError, match="third") as exc_info:
+            always_fails()
+        
+        assert exc_info.value.__context__ is None
+        assert len(sleeps) == 2
+    
+    def test_combined_decorator_stops_retrying_when_circuit_opens(
+        self, sleeps: List[float]
+    ) -> None:
+        """Test that retries stop as soon as the circuit trips mid-chain."""
+        combined = RetryWithCircuitBreaker(max_attempts=5, failure_threshold=2)
+        call_count = 0
+        
+        @combined
+        def always_fails() -> None:
+            nonlocal call_count
+            call_count += 1
+            raise ValueError("error")
+        
+        with pytest.raises(ValueError):
+            always_fails()
+        
+        assert call_count == 2
+        assert len(sleeps) == 1
+        assert combined.circuit_breaker.state == CircuitState.OPEN
+    
+    def test_combined_decorator_decorrelated_jitter(self, sleeps: List[float]) -> None:
+        """Test decorrelated jitter keeps each wait between delay and the cap."""
+        combined = RetryWithCircuitBreaker(
+            max_attempts=6,
+            delay=1.0,
+            failure_threshold=10,
+            max_delay=5.0,
+            decorrelated_jitter=True
+        )
+        
+        @combined
+        def always_fails() -> None:
+            raise ValueError("error")
+        
+        with pytest.raises(ValueError):
+            always_fails()
+        
+        assert len(sleeps) == 5
+        assert sleeps[0] == 1.0
+        assert all(1.0 <= w <= 5.0 for w in sleeps)
+    
+    def test_combined_decorator_fails_fast_when_open(self, sleeps: List[float]) -> None:
+        """Test that an OPEN circuit rejects the call without retrying."""
+        combined = RetryWithCircuitBreaker(max_attempts=3, failure_threshold=1)
+        combined.circuit_breaker._state = CircuitState.OPEN
+        combined.circuit_breaker._last_failure_time = time.monotonic()
+        mock_func = MagicMock(return_value="success")
+        
+        @combined
+        def protected_func() -> object:
+            return mock_func()
+        
+        with pytest.raises(CircuitBreakerOpenError):
+            protected_func()
+        
+        assert mock_func.call_count == 0
+        assert sleeps == []
 
 
 class TestEdgeCases:
     """Test edge cases for error handling."""
     
-    @patch("trader.error_handling.time.sleep")
-    def test_retry_with_zero_delay(self, mock_sleep: MagicMock) -> None:
+    def test_retry_with_zero_delay(self, sleeps: List[float]) -> None:
         """Test retry with zero delay - no sleep between attempts."""
         call_count = 0
         
         @retry(max_attempts=3, exceptions=(ValueError,), delay=0.0)
-        def always_fails():
+        def always_fails() -> None:
             nonlocal call_count
             call_count += 1
             raise ValueError("error")
@@ -484,28 +817,26 @@ class TestEdgeCases:
             always_fails()
         
         # Should still call sleep with 0.0
-        assert mock_sleep.call_count == 2  # 2 sleeps for 3 attempts
+        assert sleeps == [0.0, 0.0]  # 2 sleeps for 3 attempts
     
-    def test_retry_with_backoff_one(self) -> None:
+    def test_retry_with_backoff_one(self, sleeps: List[float]) -> None:
         """Test retry with backoff of 1 (no escalation)."""
-        with patch("trader.error_handling.time.sleep") as mock_sleep:
-            @retry(max_attempts=3, exceptions=(ValueError,), delay=2.0, backoff=1.0)
-            def always_fails():
-                raise ValueError("error")
-            
-            with pytest.raises(MaxRetriesExceededError):
-                always_fails()
-            
-            # With backoff=1, delay should be constant
-            assert mock_sleep.call_count == 2
-            assert all(call[0][0] == 2.0 for call in mock_sleep.call_args_list)
+        @retry(max_attempts=3, exceptions=(ValueError,), delay=2.0, backoff=1.0)
+        def always_fails() -> None:
+            raise ValueError("error")
+        
+        with pytest.raises(MaxRetriesExceededError):
+            always_fails()
+        
+        # With backoff=1, delay should be constant
+        assert sleeps == [2.0, 2.0]
     
     def test_circuit_breaker_unexpected_exception_not_counted(self) -> None:
         """Test that unexpected exceptions don't trigger circuit breaker."""
         cb = CircuitBreaker(expected_exception=ValueError)
         
         @cb
-        def raises_runtime_error():
+        def raises_runtime_error() -> None:
             raise RuntimeError("unexpected")
         
         with pytest.raises(RuntimeError):